@@ -359,10 +359,15 @@ def patient_hospitals(lat: float, lon: float, country: str = "DE", n: int = 5):
     except Exception as exc:
         logger.error("Hospital search error: %s", exc)
         # Fallback: compute straight-line distance from embedded list
-        from src.maps_handler import GERMANY_HOSPITALS
+        from src.maps_handler import GERMANY_HOSPITALS, distances_km
+        # Every row's distance in one pass
+        dists = distances_km(
+            lat, lon,
+            [h["lat"] for h in GERMANY_HOSPITALS],
+            [h["lon"] for h in GERMANY_HOSPITALS],
+        )
         results = []
-        for h in GERMANY_HOSPITALS:
-            dist = maps._haversine_distance(lat, lon, h["lat"], h["lon"])
+        for h, dist in zip(GERMANY_HOSPITALS, dists):
             eta  = int(dist / 0.7)  # rough 42 km/h urban speed
             results.append({
                 "name":        h["name"],
@@ -593,23 +598,14 @@ async def patient_transcribe(audio: UploadFile = File(...)):
                     except Exception:
                         pass
 
-            from src.speech_handler import SpeechHandler as _SH
-            speech = _SH()
+            speech = _get_speech()
             if speech._initialized:
-                wav_path = speech.convert_browser_audio_to_wav(raw, source_suffix=suffix)
-                if wav_path:
-                    result = speech.recognize_from_audio_file(wav_path)
-                    try:
-                        _os.unlink(wav_path)
-                    except Exception:
-                        pass
-                    if result and result.get("text", "").strip():
-                        logger.info("Transcribed via Azure Speech: %sâ€¦", result["text"][:60])
-                        return {"text": result["text"], "language": result.get("language", "en-US")}
-                    else:
-                        logger.warning("Azure Speech returned no text â€” falling back to Whisper")
+                result = await speech.recognize_from_browser_audio_async(raw, source_suffix=suffix)
+                if result and result.get("text", "").strip():
+                    logger.info("Transcribed via Azure Speech: %sâ€¦", result["text"][:60])
+                    return {"text": result["text"], "language": result.get("language", "en-US")}
                 else:
-                    logger.warning("Audio conversion failed (ffmpeg/pydub missing?) â€” falling back to Whisper")
+                    logger.warning("Azure Speech returned no text (or audio conversion failed) â€” falling back to Whisper")
             else:
                 logger.warning("Azure Speech not initialized (check SPEECH_KEY/SPEECH_REGION) â€” falling back to Whisper")
         except ImportError:
@@ -745,24 +741,25 @@ def patient_questions(body: QuestionsRequest):
     if lang_name and not lang_hint.lower().startswith("en"):
         # Try Azure Translator first, fall back to GPT inject on individual questions
         if translator:
+            # Every question and option goes out in a single request
+            texts = []
             for q in questions:
-                q_text = q.get("question", "")
-                try:
-                    translated_q = translator.translate_from_english(q_text, body.detected_language)
-                    if translated_q:
-                        q["question"] = translated_q
-                except Exception as exc:
-                    logger.warning("Question translation failed (%s)", exc)
-
+                texts.append(q.get("question", ""))
+                texts.extend(q.get("options") or [])
+            try:
+                translated = translator.translate_many_from_english(texts, body.detected_language)
+            except Exception as exc:
+                logger.warning("Question translation failed (%s)", exc)
+                translated = texts
+            pos = 0
+            for q in questions:
+                if translated[pos]:
+                    q["question"] = translated[pos]
+                pos += 1
                 if "options" in q and q["options"]:
-                    translated_opts = []
-                    for opt in q["options"]:
-                        try:
-                            translated_opt = translator.translate_from_english(opt, body.detected_language)
-                            translated_opts.append(translated_opt if translated_opt else opt)
-                        except Exception:
-                            translated_opts.append(opt)
-                    q["options"] = translated_opts
+                    n_opts = len(q["options"])
+                    q["options"] = [t or opt for t, opt in zip(translated[pos:pos + n_opts], q["options"])]
+                    pos += n_opts
         else:
             # No Azure Translator: re-generate questions with language injection
             # but keep question_en already set above
@@ -949,13 +946,20 @@ def api_update_location(patient_id: str, body: dict):
             patient_record = next((p for p in all_p if p["patient_id"] == patient_id), None)
             
             if patient_record and patient_record.get("destination_hospital"):
+                from src.maps_handler import get_hospital_by_name
                 maps = _get_maps()
-                # Recalculate ETA dynamically using your MapsHandler (assumes standard structure)
-                hospitals = maps.find_nearest_hospitals(lat, lon, count=20) 
-                for h in hospitals:
-                    if h["name"] == patient_record["destination_hospital"]:
-                        eta_minutes = h["eta_minutes"]
-                        break
+                # Recalculate ETA to the destination only, looked up by name
+                dest = get_hospital_by_name(patient_record["destination_hospital"])
+                if dest:
+                    eta_minutes = maps.calculate_eta_to_hospital(lat, lon, dest["lat"], dest["lon"])["eta_minutes"]
+                else:
+                    # Live Azure Maps POIs are not in the static table, so
+                    # fall back to matching them among nearby hospitals
+                    hospitals = maps.find_nearest_hospitals(lat, lon, count=20)
+                    for h in hospitals:
+                        if h["name"] == patient_record["destination_hospital"]:
+                            eta_minutes = h["eta_minutes"]
+                            break
         except Exception as e:
             logger.warning("Dynamic ETA calculation failed: %s", e)
 
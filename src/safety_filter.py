@@ -12,8 +12,14 @@ AI-102 Concepts:
 
 from __future__ import annotations
 
+import asyncio
+import hashlib
+import importlib.util
 import logging
 import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional
 
 from dotenv import load_dotenv
@@ -21,6 +27,14 @@ from dotenv import load_dotenv
 load_dotenv()
 logger = logging.getLogger(__name__)
 
+# Triage inputs repeat often (symptom phrases, re-submissions), so verdicts
+# are memoised by a digest of the text plus the active thresholds.
+_ANALYSIS_CACHE_MAX = 1024
+# Concurrent requests when a conversation is checked in one go
+_MAX_BATCH_WORKERS = 8
+# azure.ai.contentsafety.aio runs over aiohttp, which is an optional extra
+_AIO_TRANSPORT = importlib.util.find_spec("aiohttp") is not None
+
 
 class SafetyFilter:
     """Content safety filter using Azure AI Content Safety.
@@ -51,6 +65,8 @@ class SafetyFilter:
         self.key: str = os.getenv("CONTENT_SAFETY_KEY", "")
         self.client = None
         self._initialized = False
+        self._cache: OrderedDict[tuple, tuple] = OrderedDict()
+        self._cache_lock = threading.Lock()
         self._init_client()
 
     def _init_client(self) -> None:
@@ -88,7 +104,8 @@ class SafetyFilter:
 
         AI-102: The analyze_text method returns severity scores (0-6)
         for each category. Content is flagged if any category exceeds
-        the configured threshold.
+        the configured threshold. Verdicts are cached per (text,
+        thresholds); service errors are not cached.
 
         Args:
             text: Text to analyze.
@@ -102,41 +119,174 @@ class SafetyFilter:
             return {"is_safe": True, "categories": {}, "flagged_categories": []}
 
         active_thresholds = thresholds or self.DEFAULT_THRESHOLDS
+        cache_key = self._cache_key(text, active_thresholds)
+        cached = self._cache_get(cache_key)
+        if cached is not None:
+            return cached
 
         try:
             from azure.ai.contentsafety.models import AnalyzeTextOptions
 
-            request = AnalyzeTextOptions(text=text)
-            response = self.client.analyze_text(request)
+            response = self.client.analyze_text(AnalyzeTextOptions(text=text))
+            return self._build_result(response, active_thresholds, cache_key)
 
-            categories = {}
-            flagged = []
+        except Exception as exc:
+            logger.error("Content safety analysis error: %s", exc)
+            # Fail open — allow content if safety service fails
+            return {"is_safe": True, "categories": {}, "flagged_categories": []}
 
-            for item in response.categories_analysis:
-                category_name = item.category.value if hasattr(item.category, "value") else str(item.category)
-                severity = item.severity
-                categories[category_name] = severity
+    def analyze_texts(
+        self,
+        texts: list[str],
+        thresholds: Optional[dict[str, int]] = None,
+    ) -> list[dict]:
+        """Analyze several texts (e.g. every turn of a conversation).
 
-                threshold = active_thresholds.get(category_name, 4)
-                if severity >= threshold:
-                    flagged.append(category_name)
+        AI-102: The text:analyze operation takes one text per request, so
+        distinct uncached texts are sent concurrently on a small thread
+        pool; total latency is roughly one round trip instead of one per
+        turn. Repeated turns are analyzed once.
 
-            is_safe = len(flagged) == 0
+        Args:
+            texts: Texts to analyze.
+            thresholds: Optional custom thresholds per category.
 
-            if not is_safe:
-                logger.warning(
-                    "Content flagged: %s (categories: %s)",
-                    flagged,
-                    categories,
-                )
+        Returns:
+            One analyze_text result dict per input text, in order.
+        """
+        unique = list(dict.fromkeys(texts))
+        if len(unique) < 2 or not self._initialized:
+            results = {t: self.analyze_text(t, thresholds) for t in unique}
+        else:
+            with ThreadPoolExecutor(max_workers=min(_MAX_BATCH_WORKERS, len(unique))) as pool:
+                results = dict(zip(
+                    unique, pool.map(lambda t: self.analyze_text(t, thresholds), unique)
+                ))
+        return [
+            {**results[t], "categories": dict(results[t]["categories"]),
+             "flagged_categories": list(results[t]["flagged_categories"])}
+            for t in texts
+        ]
 
-            return {
-                "is_safe": is_safe,
-                "categories": categories,
-                "flagged_categories": flagged,
-            }
+    async def analyze_text_async(
+        self,
+        text: str,
+        thresholds: Optional[dict[str, int]] = None,
+    ) -> dict:
+        """Analyze text without blocking the event loop.
+
+        AI-102: azure.ai.contentsafety.aio exposes the same client over
+        aiohttp, so the safety check can run as a task alongside the
+        main model call and its round trip is hidden behind it::
+
+            safety_task = asyncio.create_task(f.analyze_text_async(text))
+            llm_result = await llm_call(text)
+            safety = await safety_task
+
+        Args:
+            text: Text to analyze.
+            thresholds: Optional custom thresholds per category.
+
+        Returns:
+            Same dict shape as analyze_text.
+        """
+        if not self._initialized:
+            return {"is_safe": True, "categories": {}, "flagged_categories": []}
+
+        active_thresholds = thresholds or self.DEFAULT_THRESHOLDS
+        cache_key = self._cache_key(text, active_thresholds)
+        cached = self._cache_get(cache_key)
+        if cached is not None:
+            return cached
+
+        if not _AIO_TRANSPORT:
+            # Without aiohttp the sync client runs on a worker thread, so
+            # the loop is still not blocked.
+            return await asyncio.to_thread(self.analyze_text, text, thresholds)
+
+        try:
+            from azure.ai.contentsafety.aio import (
+                ContentSafetyClient as AsyncContentSafetyClient,
+            )
+            from azure.ai.contentsafety.models import AnalyzeTextOptions
+            from azure.core.credentials import AzureKeyCredential
+
+            # The aio client is bound to the running loop, so it is
+            # opened per call rather than shared across loops.
+            async with AsyncContentSafetyClient(
+                endpoint=self.endpoint,
+                credential=AzureKeyCredential(self.key),
+            ) as client:
+                response = await client.analyze_text(
+                    AnalyzeTextOptions(text=text)
+                )
+            return self._build_result(response, active_thresholds, cache_key)
 
         except Exception as exc:
             logger.error("Content safety analysis error: %s", exc)
             # Fail open — allow content if safety service fails
-            return {"is_safe": True, "categories": {}, "flagged_categories": []}
\ No newline at end of file
+            return {"is_safe": True, "categories": {}, "flagged_categories": []}
+
+    @staticmethod
+    def _cache_key(text: str, thresholds: dict[str, int]) -> tuple:
+        """Content-addressed cache key for a (text, thresholds) pair."""
+        return (
+            hashlib.blake2b(text.encode("utf-8"), digest_size=16).digest(),
+            tuple(sorted(thresholds.items())),
+        )
+
+    def _cache_get(self, cache_key: tuple) -> Optional[dict]:
+        """Return a fresh copy of a cached verdict, or None on miss."""
+        with self._cache_lock:
+            cached = self._cache.get(cache_key)
+            if cached is None:
+                return None
+            self._cache.move_to_end(cache_key)
+        categories, flagged = cached
+        return {
+            "is_safe": not flagged,
+            "categories": dict(categories),
+            "flagged_categories": list(flagged),
+        }
+
+    def _build_result(
+        self,
+        response,
+        thresholds: dict[str, int],
+        cache_key: tuple,
+    ) -> dict:
+        """Apply thresholds to an analyze_text response and cache it."""
+        categories = {}
+        flagged = []
+
+        for item in response.categories_analysis:
+            category_name = item.category.value if hasattr(item.category, "value") else str(item.category)
+            severity = item.severity
+            categories[category_name] = severity
+
+            threshold = thresholds.get(category_name, 4)
+            if severity >= threshold:
+                flagged.append(category_name)
+
+        is_safe = len(flagged) == 0
+
+        if not is_safe:
+            logger.warning(
+                "Content flagged: %s (categories: %s)",
+                flagged,
+                categories,
+            )
+
+        with self._cache_lock:
+            self._cache[cache_key] = (
+                tuple(categories.items()),
+                tuple(flagged),
+            )
+            if len(self._cache) > _ANALYSIS_CACHE_MAX:
+                self._cache.popitem(last=False)
+
+        return {
+            "is_safe": is_safe,
+            "categories": categories,
+            "flagged_categories": flagged,
+        }
@@ -13,15 +13,30 @@ AI-102 Concepts:
 
 from __future__ import annotations
 
+import asyncio
+import functools
+import importlib.util
+import io
 import logging
 import os
-from typing import Optional
+import shutil
+import threading
+import time
+from contextlib import contextmanager
+from typing import Iterator, Optional
 
 from dotenv import load_dotenv
 
 load_dotenv()
 logger = logging.getLogger(__name__)
 
+# Imported once here rather than in every method; the SDK stays optional
+# (voice features are disabled without it).
+try:
+    import azure.cognitiveservices.speech as speechsdk
+except ImportError:
+    speechsdk = None
+
 # Supported languages for auto-detection
 # AI-102: Azure Speech AutoDetectSourceLanguageConfig supports up to 10 languages
 # in Continuous recognition mode, but only UP TO 4 in DetectAudioAtStart mode
@@ -67,6 +82,35 @@ LANGUAGE_NAMES: dict[str, str] = {
     "zh-CN": "中文",
 }
 
+# Long-lived recognizers are rebuilt after this long: the service drops
+# idle websocket connections, and a recognizer on a dead connection fails
+# its next call instead of reconnecting.
+_RECOGNIZER_MAX_AGE_S = 240
+
+# Audio per write when streaming a file into the recognizer (100 ms)
+_STREAM_FRAME_S = 0.1
+# Upper bound on waiting for continuous recognition of a file
+_FILE_RECOGNITION_TIMEOUT_S = 120
+
+# ffmpeg output options for Azure Speech input: 16 kHz, mono, 16-bit PCM
+_FFMPEG_WAV_ARGS = ("-ar", "16000", "-ac", "1", "-sample_fmt", "s16")
+_FFMPEG_PCM_ARGS = ("-ar", "16000", "-ac", "1", "-f", "s16le")
+
+
+@functools.cache
+def _audio_backend() -> Optional[str]:
+    """Browser-audio converter available on this host, discovered once.
+
+    Returns:
+        ``"ffmpeg"`` if the binary is on PATH, else ``"pydub"`` if the
+        package is installed, else ``None``.
+    """
+    if shutil.which("ffmpeg"):
+        return "ffmpeg"
+    if importlib.util.find_spec("pydub") is not None:
+        return "pydub"
+    return None
+
 
 class SpeechHandler:
     """Handles speech-to-text with automatic language detection.
@@ -87,6 +131,21 @@ class SpeechHandler:
         self.speech_region: str = os.getenv("SPEECH_REGION", "westeurope")
         self.speech_config = None
         self._initialized = False
+        # SDK objects reused across calls (built lazily, guarded by _sdk_lock):
+        # the auto-detect config, the microphone recognizer and one
+        # synthesizer per voice language.
+        self._auto_detect_config = None
+        self._mic_audio_config = None
+        self._mic_recognizer = None
+        self._mic_recognizer_created_at = 0.0
+        self._synthesizers: dict = {}
+        # _sdk_lock only covers building/looking up these objects. Using
+        # them is serialized separately: _mic_lock for the whole of a mic
+        # capture, and one lock per synthesizer while it speaks, so TTS
+        # never waits behind a mic capture.
+        self._synthesizer_locks: dict[str, threading.Lock] = {}
+        self._mic_lock = threading.Lock()
+        self._sdk_lock = threading.Lock()
         self._init_config()
 
     def _init_config(self) -> None:
@@ -101,9 +160,12 @@ class SpeechHandler:
                 "Voice input will be unavailable; text input still works."
             )
             return
+        if speechsdk is None:
+            logger.error(
+                "azure-cognitiveservices-speech package not installed."
+            )
+            return
         try:
-            import azure.cognitiveservices.speech as speechsdk
-
             self.speech_config = speechsdk.SpeechConfig(
                 subscription=self.speech_key,
                 region=self.speech_region,
@@ -112,12 +174,14 @@ class SpeechHandler:
             self.speech_config.output_format = (
                 speechsdk.OutputFormat.Detailed
             )
+            # AI-102: Built once here and shared by every recognizer
+            self._auto_detect_config = (
+                speechsdk.languageconfig.AutoDetectSourceLanguageConfig(
+                    languages=AUTO_DETECT_LANGUAGES
+                )
+            )
             self._initialized = True
             logger.info("Azure Speech config initialized (region=%s).", self.speech_region)
-        except ImportError:
-            logger.error(
-                "azure-cognitiveservices-speech package not installed."
-            )
         except Exception as exc:
             logger.error("Failed to init Speech config: %s", exc)
 
@@ -141,30 +205,9 @@ class SpeechHandler:
             return None
 
         try:
-            import azure.cognitiveservices.speech as speechsdk
-
-            # AI-102: Configure auto-detection from candidate languages
-            # FIX: DetectAudioAtStart (recognize_once) supports max 4 languages
-            auto_detect_config = (
-                speechsdk.languageconfig.AutoDetectSourceLanguageConfig(
-                    languages=AUTO_DETECT_LANGUAGES
-                )
-            )
-
-            # AI-102: AudioConfig.use_default_microphone() routes audio
-            # from the system's default microphone device
-            audio_config = speechsdk.audio.AudioConfig(
-                use_default_microphone=True
-            )
-
-            recognizer = speechsdk.SpeechRecognizer(
-                speech_config=self.speech_config,
-                auto_detect_source_language_config=auto_detect_config,
-                audio_config=audio_config,
-            )
-
-            logger.info("Listening for speech input...")
-            result = recognizer.recognize_once()
+            with self._mic_recognizer_lease() as recognizer:
+                logger.info("Listening for speech input...")
+                result = recognizer.recognize_once()
 
             return self._process_result(result)
 
@@ -172,6 +215,80 @@ class SpeechHandler:
             logger.error("Speech recognition error: %s", exc)
             return None
 
+    async def recognize_from_microphone_async(self) -> Optional[dict]:
+        """recognize_from_microphone without blocking the event loop.
+
+        The SDK call waits for a whole utterance, so it runs on a worker
+        thread and concurrent requests in an async server keep moving.
+        """
+        return await asyncio.to_thread(self.recognize_from_microphone)
+
+    def stream_from_microphone(
+        self,
+        stop_event: Optional[threading.Event] = None,
+        max_duration_s: float = 30.0,
+    ) -> Iterator[tuple[str, object]]:
+        """Recognize continuously from the microphone, yielding as it goes.
+
+        AI-102: start_continuous_recognition_async() keeps the audio
+        flowing while earlier audio is being decoded; the ``recognizing``
+        event carries partial hypotheses and ``recognized`` each final
+        utterance, so the UI can render text while the patient speaks
+        instead of waiting for recognize_once() to return.
+
+        Args:
+            stop_event: Set it (e.g. from a UI stop button) to end the
+                session; the session also ends on cancellation.
+            max_duration_s: Upper bound on the session length.
+
+        Yields:
+            ``("partial", text)`` while speaking, and
+            ``("final", result_dict)`` per recognized utterance (same
+            dict shape as recognize_from_microphone).
+        """
+        if not self._initialized:
+            logger.warning("Speech not initialized.")
+            return
+
+        import queue
+
+        events: queue.Queue = queue.Queue()
+        # A continuous session holds the microphone for its whole length,
+        # so it gets its own recognizer rather than the shared one.
+        recognizer = speechsdk.SpeechRecognizer(
+            speech_config=self.speech_config,
+            auto_detect_source_language_config=self._get_auto_detect_config(),
+            audio_config=self._get_mic_audio_config(),
+        )
+        recognizer.recognizing.connect(lambda evt: events.put(("partial", evt.result.text)))
+        recognizer.recognized.connect(lambda evt: events.put(("final", evt.result)))
+        recognizer.session_stopped.connect(lambda evt: events.put(None))
+        recognizer.canceled.connect(lambda evt: events.put(None))
+
+        recognizer.start_continuous_recognition_async().get()
+        logger.info("Listening for speech input (continuous)...")
+        deadline = time.monotonic() + max_duration_s
+        try:
+            while stop_event is None or not stop_event.is_set():
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    item = events.get(timeout=min(remaining, 0.1))
+                except queue.Empty:
+                    continue
+                if item is None:
+                    break
+                kind, payload = item
+                if kind == "final":
+                    parsed = self._process_result(payload)
+                    if parsed is not None:
+                        yield "final", parsed
+                elif payload:
+                    yield "partial", payload
+        finally:
+            recognizer.stop_continuous_recognition_async().get()
+
     def convert_browser_audio_to_wav(self, raw_bytes: bytes, source_suffix: str = ".webm") -> Optional[str]:
         """Convert browser audio bytes (WebM/Opus) to a WAV temp file.
 
@@ -191,6 +308,11 @@ class SpeechHandler:
         import subprocess
         import tempfile
 
+        backend = _audio_backend()
+        if backend is None:
+            logger.warning("No audio converter available (install ffmpeg or pydub).")
+            return None
+
         # Write raw browser audio to a temp file
         try:
             with tempfile.NamedTemporaryFile(suffix=source_suffix, delete=False) as src_file:
@@ -200,24 +322,19 @@ class SpeechHandler:
             wav_path = src_path.replace(source_suffix, ".wav")
 
             # Strategy 1: ffmpeg (most reliable, handles all browser formats)
-            try:
-                subprocess.run(
-                    [
-                        "ffmpeg", "-y", "-i", src_path,
-                        "-ar", "16000",          # 16 kHz — Azure Speech requirement
-                        "-ac", "1",              # mono
-                        "-sample_fmt", "s16",    # 16-bit PCM
-                        wav_path,
-                    ],
-                    check=True,
-                    capture_output=True,
-                    timeout=30,
-                )
-                os.unlink(src_path)
-                logger.info("ffmpeg converted browser audio to WAV: %s", wav_path)
-                return wav_path
-            except (subprocess.CalledProcessError, FileNotFoundError, subprocess.TimeoutExpired) as ffmpeg_err:
-                logger.warning("ffmpeg not available or failed (%s), trying pydub.", ffmpeg_err)
+            if backend == "ffmpeg":
+                try:
+                    subprocess.run(
+                        ("ffmpeg", "-y", "-i", src_path, *_FFMPEG_WAV_ARGS, wav_path),
+                        check=True,
+                        capture_output=True,
+                        timeout=30,
+                    )
+                    os.unlink(src_path)
+                    logger.info("ffmpeg converted browser audio to WAV: %s", wav_path)
+                    return wav_path
+                except (subprocess.CalledProcessError, FileNotFoundError, subprocess.TimeoutExpired) as ffmpeg_err:
+                    logger.warning("ffmpeg failed (%s), trying pydub.", ffmpeg_err)
 
             # Strategy 2: pydub (requires ffmpeg internally but may be on PATH differently)
             try:
@@ -238,11 +355,19 @@ class SpeechHandler:
             logger.error("Audio conversion error: %s", exc)
             return None
 
-    def recognize_from_audio_file(self, audio_path: str) -> Optional[dict]:
-        """Recognize speech from an audio file (WAV format).
+    def recognize_from_browser_audio(self, raw_bytes: bytes, source_suffix: str = ".webm") -> Optional[dict]:
+        """Recognize speech from raw browser audio without touching disk.
+
+        ffmpeg decodes the upload through pipes straight to 16 kHz mono
+        PCM, which is streamed to Azure Speech via a ``PushAudioInputStream``
+        with continuous recognition (see recognize_from_audio_file).
+        Containers that cannot be decoded from a pipe (e.g. MP4 from Safari,
+        which needs seeking) fall back to the temp-file WAV path.
 
         Args:
-            audio_path: Path to a WAV audio file.
+            raw_bytes: Raw audio bytes from the browser.
+            source_suffix: File extension hint for the input format,
+                           used only by the temp-file fallback.
 
         Returns:
             Recognition result dict or ``None``.
@@ -251,31 +376,204 @@ class SpeechHandler:
             logger.warning("Speech not initialized.")
             return None
 
+        pcm = self._browser_audio_to_pcm(raw_bytes)
+        if pcm is None:
+            wav_path = self.convert_browser_audio_to_wav(raw_bytes, source_suffix=source_suffix)
+            if not wav_path:
+                return None
+            try:
+                return self.recognize_from_audio_file(wav_path)
+            finally:
+                try:
+                    os.unlink(wav_path)
+                except OSError:
+                    pass
+
         try:
-            import azure.cognitiveservices.speech as speechsdk
+            # AI-102: the decoded PCM goes through the same framed
+            # PushAudioInputStream + continuous recognition path as files,
+            # so every utterance in the recording is kept
+            return self._recognize_pcm(io.BytesIO(pcm), (16000, 16, 1))
 
-            # FIX: DetectAudioAtStart (used with recognize_once) supports max 4 languages
-            auto_detect_config = (
-                speechsdk.languageconfig.AutoDetectSourceLanguageConfig(
-                    languages=AUTO_DETECT_LANGUAGES
-                )
-            )
+        except Exception as exc:
+            logger.error("Speech recognition from stream error: %s", exc)
+            return None
+
+    async def recognize_from_browser_audio_async(
+        self, raw_bytes: bytes, source_suffix: str = ".webm"
+    ) -> Optional[dict]:
+        """recognize_from_browser_audio without blocking the event loop.
+
+        Decoding (ffmpeg) and recognition both block, so the whole call
+        runs on a worker thread.
+        """
+        return await asyncio.to_thread(
+            self.recognize_from_browser_audio, raw_bytes, source_suffix
+        )
+
+    @staticmethod
+    def _browser_audio_to_pcm(raw_bytes: bytes) -> Optional[bytes]:
+        """Decode browser audio to raw 16 kHz mono 16-bit PCM in memory.
 
-            audio_config = speechsdk.audio.AudioConfig(filename=audio_path)
+        Returns:
+            PCM bytes, or ``None`` if ffmpeg is missing or cannot decode
+            the input from a pipe.
+        """
+        import subprocess
 
-            recognizer = speechsdk.SpeechRecognizer(
-                speech_config=self.speech_config,
-                auto_detect_source_language_config=auto_detect_config,
-                audio_config=audio_config,
+        if _audio_backend() != "ffmpeg":
+            return None
+        try:
+            proc = subprocess.run(
+                ("ffmpeg", "-i", "pipe:0", *_FFMPEG_PCM_ARGS, "pipe:1"),
+                input=raw_bytes,
+                check=True,
+                capture_output=True,
+                timeout=30,
             )
+        except (subprocess.CalledProcessError, FileNotFoundError, subprocess.TimeoutExpired) as ffmpeg_err:
+            logger.warning("ffmpeg pipe decode failed (%s).", ffmpeg_err)
+            return None
+        return proc.stdout or None
 
-            result = recognizer.recognize_once()
-            return self._process_result(result)
+    def recognize_from_audio_file(self, audio_path: str) -> Optional[dict]:
+        """Recognize all speech in an audio file.
+
+        AI-102: The file is streamed into a PushAudioInputStream in 100 ms
+        frames by a worker thread while continuous recognition decodes
+        earlier frames, so upload and recognition overlap. Every
+        recognized utterance is kept (recognize_once() would stop after
+        the first). PCM WAV files are streamed as-is; anything else is
+        first decoded to 16 kHz mono PCM with ffmpeg.
+
+        Args:
+            audio_path: Path to an audio file (PCM WAV preferred).
+
+        Returns:
+            Recognition result dict (utterance texts joined, language and
+            confidence of the first) or ``None``.
+        """
+        if not self._initialized:
+            logger.warning("Speech not initialized.")
+            return None
+
+        try:
+            wav = self._open_pcm_wav(audio_path)
+            if wav is not None:
+                fmt = (wav.getframerate(), 8 * wav.getsampwidth(), wav.getnchannels())
+                source = wav
+            else:
+                with open(audio_path, "rb") as fh:
+                    pcm = self._browser_audio_to_pcm(fh.read())
+                if pcm is None:
+                    logger.error("Cannot decode audio file %s.", audio_path)
+                    return None
+                fmt = (16000, 16, 1)
+                source = io.BytesIO(pcm)
+            return self._recognize_pcm(source, fmt)
 
         except Exception as exc:
             logger.error("Speech recognition from file error: %s", exc)
             return None
 
+    def _recognize_pcm(self, source, fmt: tuple[int, int, int]) -> Optional[dict]:
+        """Stream PCM into continuous recognition and merge the utterances.
+
+        Args:
+            source: WAV reader or byte buffer holding PCM audio.
+            fmt: (samples per second, bits per sample, channels) of source.
+
+        Returns:
+            Merged recognition result dict or ``None``.
+        """
+        stream = speechsdk.audio.PushAudioInputStream(
+            stream_format=speechsdk.audio.AudioStreamFormat(
+                samples_per_second=fmt[0], bits_per_sample=fmt[1], channels=fmt[2],
+            )
+        )
+        frame_bytes = int(fmt[0] * _STREAM_FRAME_S) * (fmt[1] // 8) * fmt[2]
+        threading.Thread(
+            target=self._pump_audio, args=(source, stream, frame_bytes), daemon=True
+        ).start()
+
+        # A recognizer is bound to its audio source, so stream input needs
+        # a new one per call; the language config is shared.
+        recognizer = speechsdk.SpeechRecognizer(
+            speech_config=self.speech_config,
+            auto_detect_source_language_config=self._get_auto_detect_config(),
+            audio_config=speechsdk.audio.AudioConfig(stream=stream),
+        )
+        return self._recognize_until_stopped(recognizer)
+
+    def _recognize_until_stopped(self, recognizer) -> Optional[dict]:
+        """Run continuous recognition until the stream ends; merge utterances."""
+        finals: list = []
+        errors: list = []
+        done = threading.Event()
+
+        def on_canceled(evt) -> None:
+            # End of stream also arrives as a cancellation; only errors count
+            if evt.cancellation_details.reason == speechsdk.CancellationReason.Error:
+                errors.append(evt.result)
+            done.set()
+
+        recognizer.recognized.connect(lambda evt: finals.append(evt.result))
+        recognizer.session_stopped.connect(lambda evt: done.set())
+        recognizer.canceled.connect(on_canceled)
+
+        recognizer.start_continuous_recognition_async().get()
+        if not done.wait(timeout=_FILE_RECOGNITION_TIMEOUT_S):
+            logger.warning("File recognition timed out; keeping partial result.")
+        recognizer.stop_continuous_recognition_async().get()
+
+        parsed = [r for r in map(self._process_result, finals) if r is not None]
+        if not parsed:
+            if errors:
+                self._process_result(errors[0])  # logs the cancellation details
+            return None
+        return {
+            "text": " ".join(r["text"] for r in parsed),
+            "language": parsed[0]["language"],
+            "language_code": parsed[0]["language_code"],
+            "confidence": parsed[0]["confidence"],
+        }
+
+    @staticmethod
+    def _open_pcm_wav(audio_path: str):
+        """Open a PCM WAV file for streaming, or None if it is not one."""
+        import wave
+
+        try:
+            wav = wave.open(audio_path, "rb")
+        except (wave.Error, EOFError, OSError):
+            return None
+        if wav.getcomptype() != "NONE":
+            wav.close()
+            return None
+        return wav
+
+    @staticmethod
+    def _pump_audio(source, stream, frame_bytes: int) -> None:
+        """Feed PCM from a WAV reader or byte buffer into a push stream.
+
+        Writes ``frame_bytes`` at a time, then closes the stream (which
+        tells the recognizer the audio has ended) and the source.
+        """
+        if hasattr(source, "readframes"):
+            # wave readers count in sample frames, not bytes
+            read = source.readframes
+            size = frame_bytes // (source.getsampwidth() * source.getnchannels())
+        else:
+            read, size = source.read, frame_bytes
+        try:
+            while chunk := read(size):
+                stream.write(chunk)
+        except Exception as exc:
+            logger.warning("Audio file streaming stopped early: %s", exc)
+        finally:
+            stream.close()
+            source.close()
+
     def text_to_speech(self, text: str, language: str = "en-US") -> bool:
         """Convert text to speech output.
 
@@ -294,13 +592,18 @@ class SpeechHandler:
             return False
 
         try:
-            import azure.cognitiveservices.speech as speechsdk
-
-            self.speech_config.speech_synthesis_language = language
-            synthesizer = speechsdk.SpeechSynthesizer(
-                speech_config=self.speech_config
-            )
-            result = synthesizer.speak_text_async(text).get()
+            with self._sdk_lock:
+                # The voice language is fixed when a synthesizer is built,
+                # so keep one per language and reuse it.
+                synthesizer = self._synthesizers.get(language)
+                if synthesizer is None:
+                    synthesizer = self._build_synthesizer(language)
+                    self._synthesizers[language] = synthesizer
+                    self._synthesizer_locks[language] = threading.Lock()
+                synthesizer_lock = self._synthesizer_locks[language]
+
+            with synthesizer_lock:
+                result = synthesizer.speak_text_async(text).get()
 
             if result.reason == speechsdk.ResultReason.SynthesizingAudioCompleted:
                 logger.info("TTS completed for language %s.", language)
@@ -317,6 +620,84 @@ class SpeechHandler:
     # Helpers
     # ------------------------------------------------------------------
 
+    @contextmanager
+    def _mic_recognizer_lease(self) -> Iterator:
+        """Hold the shared microphone recognizer for one recognition.
+
+        The recognizer (and its service connection) is built on first use
+        and reused while it is younger than _RECOGNIZER_MAX_AGE_S; an older
+        one is rebuilt first. If the recognition raises, the recognizer is
+        dropped so the next call starts from a fresh connection.
+
+        _mic_lock is held for the whole lease; _sdk_lock only while the
+        recognizer is checked or rebuilt.
+        """
+        with self._mic_lock:
+            with self._sdk_lock:
+                now = time.monotonic()
+                if (self._mic_recognizer is None
+                        or now - self._mic_recognizer_created_at > _RECOGNIZER_MAX_AGE_S):
+                    # The audio source never changes, so one recognizer
+                    # serves every call.
+                    self._mic_recognizer = speechsdk.SpeechRecognizer(
+                        speech_config=self.speech_config,
+                        auto_detect_source_language_config=self._get_auto_detect_config(),
+                        audio_config=self._get_mic_audio_config(),
+                    )
+                    self._mic_recognizer_created_at = now
+                recognizer = self._mic_recognizer
+            try:
+                yield recognizer
+            except Exception:
+                with self._sdk_lock:
+                    self._mic_recognizer = None
+                raise
+
+    def _build_synthesizer(self, language: str):
+        """Create a synthesizer for ``language`` with its connection open.
+
+        AI-102: Connection.open(True) pre-connects the synthesizer's
+        websocket, so the first speak call only waits for audio; the
+        connection then stays up for reuse. Callers hold _sdk_lock.
+        """
+        self.speech_config.speech_synthesis_language = language
+        synthesizer = speechsdk.SpeechSynthesizer(speech_config=self.speech_config)
+        try:
+            speechsdk.Connection.from_speech_synthesizer(synthesizer).open(True)
+        except Exception as exc:
+            # Not fatal: the first speak call connects on demand
+            logger.warning("TTS pre-connect failed for %s: %s", language, exc)
+        return synthesizer
+
+    def _get_auto_detect_config(self):
+        """Return the shared AutoDetectSourceLanguageConfig.
+
+        Normally built in _init_config; created here if it is missing.
+
+        FIX: DetectAudioAtStart (used with recognize_once) supports max 4
+        languages, hence AUTO_DETECT_LANGUAGES rather than the full list.
+        """
+        if self._auto_detect_config is None:
+            # AI-102: Configure auto-detection from candidate languages
+            self._auto_detect_config = (
+                speechsdk.languageconfig.AutoDetectSourceLanguageConfig(
+                    languages=AUTO_DETECT_LANGUAGES
+                )
+            )
+        return self._auto_detect_config
+
+    def _get_mic_audio_config(self):
+        """Return the shared default-microphone AudioConfig, building it once.
+
+        AI-102: AudioConfig.use_default_microphone() routes audio from the
+        system's default microphone device.
+        """
+        if self._mic_audio_config is None:
+            self._mic_audio_config = speechsdk.audio.AudioConfig(
+                use_default_microphone=True
+            )
+        return self._mic_audio_config
+
     def _process_result(self, result) -> Optional[dict]:
         """Process a speech recognition result.
 
@@ -326,8 +707,6 @@ class SpeechHandler:
         Returns:
             Parsed result dict or ``None``.
         """
-        import azure.cognitiveservices.speech as speechsdk
-
         if result.reason == speechsdk.ResultReason.RecognizedSpeech:
             # AI-102: The auto-detect language result is stored in a
             # property bag, accessed via PropertyId
@@ -343,6 +722,9 @@ class SpeechHandler:
             return {
                 "text": result.text,
                 "language": detected_language,
+                # Base code ('de-DE' -> 'de'), ready to pass to Translator
+                # as source_language so it need not detect it again
+                "language_code": detected_language.split("-")[0].lower(),
                 "confidence": getattr(result, "confidence", None),
             }
 
@@ -403,8 +785,4 @@ class SpeechHandler:
         Returns:
             True if the speech SDK is importable.
         """
-        try:
-            import azure.cognitiveservices.speech  # noqa: F401
-            return True
-        except ImportError:
-            return False
\ No newline at end of file
+        return speechsdk is not None
\ No newline at end of file
@@ -13,17 +13,228 @@ AI-102 Concepts:
 
 from __future__ import annotations
 
+import asyncio
+import functools
+import hashlib
+import itertools
+import json
 import logging
 import os
+import re
+import sqlite3
+import threading
+import time
 import uuid
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
 from typing import Optional
 
 import requests
 from dotenv import load_dotenv
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 load_dotenv()
 logger = logging.getLogger(__name__)
 
+try:
+    import orjson
+    _json_loads = orjson.loads
+    _json_dumps = orjson.dumps
+except ImportError:
+    _json_loads = json.loads
+
+    def _json_dumps(obj) -> bytes:
+        return json.dumps(obj, ensure_ascii=False).encode("utf-8")
+
+# Azure Translator v3 accepts at most 100 array elements per request
+_MAX_BATCH_ELEMENTS = 100
+# Concurrent requests when texts go to several target languages at once
+_MAX_FAN_OUT = 8
+_DETECT_PARAMS = {"api-version": "3.0"}
+# Statuses retried by the session adapter, and counted by the breaker
+_RETRY_STATUSES = (429, 500, 502, 503, 504)
+# Consecutive failed calls that open the breaker, and how long it stays open
+_BREAKER_THRESHOLD = 3
+_BREAKER_OPEN_S = 5.0
+# Send X-ClientTraceId on every request (otherwise only at DEBUG level)
+_TRACE_ENABLED = os.getenv("TRANSLATOR_TRACE", "") == "1"
+# detect_languages keeps candidates until their scores sum to this
+_DETECT_CUMULATIVE_CUTOFF = 0.99
+_UNDETERMINED = "und"
+
+# ── Untranslatable inputs ──────────────────────────────────────────────────────
+# Numbers, vitals, doses and ICD-10 codes read the same in every language.
+_MEASUREMENT_RE = re.compile(
+    r"[A-TV-Z]\d{2}(?:\.\d{1,4})?"                        # ICD-10 code, e.g. R07.4
+    r"|[<>~]?\s*\d[\d.,/:\s%+-]*"                            # 38.5, 120/80, 7/10
+    r"(?:\s*(?:mg|mcg|ml|g|kg|cm|mm|mmhg|bpm|mmol/l|c|f))?",
+    re.IGNORECASE,
+)
+
+
+def _untranslatable(text: str) -> bool:
+    """True for ASCII inputs with nothing to translate.
+
+    Short words are deliberately not skipped: option labels such as
+    "No" or "OK" do need translating into the patient's language.
+    """
+    if not text.isascii():
+        return False
+    stripped = text.strip()
+    if not any(c.isalpha() for c in stripped):
+        return True
+    return _MEASUREMENT_RE.fullmatch(stripped) is not None
+
+
+# ── Local language check ───────────────────────────────────────────────────────
+# When the caller does not know the source language, texts that are already
+# in the target language would still cost a round trip. A deliberately
+# conservative local check recognises the unambiguous cases -- plain-ASCII
+# English, and text written in one non-Latin script -- and answers None
+# otherwise, leaving the decision to the service.
+_WORD_RE = re.compile(r"[^\W\d_]+(?:'[^\W\d_]+)?")
+_EN_MARKERS = frozenset({
+    "i", "i'm", "i've", "the", "and", "is", "are", "was", "were", "have", "has",
+    "had", "my", "with", "it", "this", "that", "of", "for", "not", "you", "your",
+    "what", "how", "when", "been", "feel", "from", "since", "can't", "don't",
+})
+# Function words of the other supported Latin-script languages
+_NON_EN_MARKERS = frozenset({
+    "der", "das", "und", "ist", "ich", "nicht", "mit", "ein", "eine", "habe",
+    "haben", "sie", "auf", "seit", "mein", "meine", "sehr",
+    "ve", "bir", "bu", "var", "yok", "ben", "benim", "ile", "gibi", "daha",
+    "le", "les", "et", "est", "je", "pas", "une", "avec", "mon", "dans", "pour",
+    "el", "los", "las", "y", "tengo", "muy", "pero", "desde",
+    "il", "gli", "che", "sono", "ho", "molto", "mio", "della", "per",
+    "os", "tenho", "com", "muito", "uma", "meu", "minha", "em",
+})
+# (first, last) code point of each non-Latin script we support
+_SCRIPT_RANGES = {
+    "ar": (0x0600, 0x06FF),
+    "ru": (0x0400, 0x04FF),
+    "zh": (0x4E00, 0x9FFF),
+}
+_LOCAL_MIN_SHARE = 0.85
+
+
+def _local_language(text: str) -> Optional[str]:
+    """Language code of ``text`` when it is unambiguous locally, else None."""
+    letters = [c for c in text if c.isalpha()]
+    if not letters:
+        return None
+    if text.isascii():
+        words = _WORD_RE.findall(text.lower())
+        en_hits = sum(w in _EN_MARKERS for w in words)
+        if en_hits >= 2 and not any(w in _NON_EN_MARKERS for w in words):
+            return "en"
+        return None
+    for code, (lo, hi) in _SCRIPT_RANGES.items():
+        in_script = sum(lo <= ord(c) <= hi for c in letters)
+        if in_script >= _LOCAL_MIN_SHARE * len(letters):
+            return code
+    return None
+
+
+# ── Translation cache ──────────────────────────────────────────────────────────
+# Triage flows translate the same prompts and phrases over and over, so
+# results are kept in a process-wide LRU (shared by every Translator). Setting
+# TRANSLATION_CACHE_DB to a path adds a small SQLite table that survives
+# restarts; only English-source strings (backend prompts and replies) are
+# written there, so patient input never lands on disk.
+_CACHE_MAX = 4096
+_CACHE_MAX_CHARS = 2000   # longer texts are translated but not cached
+_CACHE_DB_PATH = os.getenv("TRANSLATION_CACHE_DB", "")
+_PERSISTED_SOURCE = "en"
+_cache: OrderedDict[tuple, str] = OrderedDict()
+_cache_lock = threading.Lock()
+_disk_lock = threading.Lock()
+
+
+def _cache_key(text: str, source_lang: Optional[str], target_lang: str) -> tuple:
+    digest = hashlib.blake2b(text.encode("utf-8"), digest_size=16).digest()
+    return (digest, source_lang or "", target_lang)
+
+
+@functools.cache
+def _disk_cache() -> Optional[sqlite3.Connection]:
+    """Open the persistent cache table once, or None if disabled/unusable."""
+    if not _CACHE_DB_PATH:
+        return None
+    try:
+        Path(_CACHE_DB_PATH).parent.mkdir(parents=True, exist_ok=True)
+        con = sqlite3.connect(_CACHE_DB_PATH, check_same_thread=False)
+        con.execute("PRAGMA journal_mode=WAL")
+        con.execute(
+            "CREATE TABLE IF NOT EXISTS translations ("
+            "text_hash BLOB NOT NULL, src TEXT NOT NULL, tgt TEXT NOT NULL, "
+            "translation TEXT NOT NULL, PRIMARY KEY (text_hash, src, tgt))"
+        )
+        con.commit()
+        return con
+    except sqlite3.Error as exc:
+        logger.warning("Translation cache DB unavailable (%s); memory only.", exc)
+        return None
+
+
+def _cache_get(key: tuple) -> Optional[str]:
+    with _cache_lock:
+        hit = _cache.get(key)
+        if hit is not None:
+            _cache.move_to_end(key)
+            return hit
+    if key[1] != _PERSISTED_SOURCE:
+        return None
+    con = _disk_cache()
+    if con is None:
+        return None
+    # The SQLite read happens outside _cache_lock so memory hits on other
+    # threads are never held up behind disk I/O.
+    try:
+        with _disk_lock:
+            row = con.execute(
+                "SELECT translation FROM translations WHERE text_hash=? AND src=? AND tgt=?", key
+            ).fetchone()
+    except sqlite3.Error:
+        return None
+    if row is None:
+        return None
+    with _cache_lock:
+        _cache_put_memory(key, row[0])
+    return row[0]
+
+
+def _cache_put_memory(key: tuple, translation: str) -> None:
+    _cache[key] = translation
+    if len(_cache) > _CACHE_MAX:
+        _cache.popitem(last=False)
+
+
+def _cache_put(items: list[tuple[tuple, str]]) -> None:
+    with _cache_lock:
+        for key, translation in items:
+            _cache_put_memory(key, translation)
+    persisted = [(*key, translation) for key, translation in items
+                 if key[1] == _PERSISTED_SOURCE]
+    if not persisted:
+        return
+    con = _disk_cache()
+    if con is None:
+        return
+    try:
+        with _disk_lock:
+            con.executemany(
+                "INSERT OR IGNORE INTO translations VALUES (?, ?, ?, ?)", persisted
+            )
+            con.commit()
+    except sqlite3.Error as exc:
+        logger.warning("Translation cache write failed: %s", exc)
+
+
+class CircuitOpenError(requests.RequestException):
+    """Raised instead of sending a request while the breaker is open."""
+
 
 class Translator:
     """Handles translation between patient language and English backend.
@@ -47,6 +258,18 @@ class Translator:
         )
         self.region: str = os.getenv("TRANSLATOR_REGION", "global")
         self._initialized = bool(self.key and self.key != "your-key")
+        self._session = self._build_session() if self._initialized else None
+        # Circuit breaker state (see _post)
+        self._breaker_failures = 0
+        self._breaker_open_until = 0.0
+        self._breaker_lock = threading.Lock()
+        # Trace IDs: random high bits once, request counter in the low 32
+        self._trace_base = uuid.uuid4().int & ~0xFFFFFFFF
+        self._trace_seq = itertools.count()
+        base_url = self.endpoint.rstrip("/")
+        self._translate_url = f"{base_url}/translate"
+        self._detect_url = f"{base_url}/detect"
+        self._languages_url = f"{base_url}/languages"
 
         if not self._initialized:
             logger.warning(
@@ -55,6 +278,107 @@ class Translator:
             )
         else:
             logger.info("Translator initialized (region=%s).", self.region)
+            threading.Thread(target=self._prewarm, daemon=True).start()
+
+    def _build_session(self) -> requests.Session:
+        """Keep-alive session for all Translator requests.
+
+        Pooled connections reuse one TLS session across translate and
+        detect calls, and the credential headers are set once here
+        instead of on every request. Throttling (429) and brief
+        server errors (5xx) are retried up to three times with exponential
+        backoff; both endpoints are safe to repeat.
+        """
+        session = requests.Session()
+        retry = Retry(
+            total=3,
+            backoff_factor=0.3,
+            status_forcelist=_RETRY_STATUSES,
+            allowed_methods=frozenset({"POST"}),
+            raise_on_status=False,
+        )
+        session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=16, max_retries=retry))
+        session.headers.update({
+            "Ocp-Apim-Subscription-Key": self.key,
+            "Ocp-Apim-Subscription-Region": self.region,
+            "Content-type": "application/json",
+        })
+        return session
+
+    def _prewarm(self) -> None:
+        """Open a pooled connection before the first real request.
+
+        GET /languages is free and unauthenticated, but resolves DNS and
+        completes the TLS handshake on the session's pool, so the first
+        patient-facing translation does not pay for them.
+        """
+        try:
+            self._session.get(
+                self._languages_url, params=_DETECT_PARAMS, timeout=5
+            ).close()
+        except requests.RequestException as exc:
+            logger.debug("Translator pre-warm failed: %s", exc)
+
+    def _post(self, url: str, params: dict, body: bytes):
+        """POST to the Translator behind the circuit breaker; parsed JSON.
+
+        Retries for a single call happen in the session's adapter. When
+        calls still fail with throttling/server errors (or no response)
+        _BREAKER_THRESHOLD times in a row, the breaker opens and calls
+        fail fast for _BREAKER_OPEN_S instead of adding load while the
+        service recovers.
+
+        Raises:
+            requests.RequestException: On HTTP failure or an open breaker.
+        """
+        with self._breaker_lock:
+            if time.monotonic() < self._breaker_open_until:
+                raise CircuitOpenError("Translator circuit open; skipping request")
+        try:
+            response = self._session.post(
+                url, params=params, headers=self._trace_headers(), data=body, timeout=10,
+            )
+        except requests.RequestException:
+            self._record_outcome(failed=True)
+            raise
+        self._record_outcome(
+            failed=response.status_code == 429 or response.status_code >= 500
+        )
+        response.raise_for_status()
+        return _json_loads(response.content)
+
+    def _record_outcome(self, failed: bool) -> None:
+        with self._breaker_lock:
+            if not failed:
+                self._breaker_failures = 0
+                return
+            self._breaker_failures += 1
+            if self._breaker_failures >= _BREAKER_THRESHOLD:
+                self._breaker_open_until = time.monotonic() + _BREAKER_OPEN_S
+                self._breaker_failures = 0
+                logger.warning(
+                    "Translator failing repeatedly; pausing requests for %.0f s.",
+                    _BREAKER_OPEN_S,
+                )
+
+    def _trace_headers(self) -> Optional[dict]:
+        """X-ClientTraceId for the request, only when tracing is wanted.
+
+        The trace ID only helps correlate a request with Azure-side logs,
+        so it is sent when TRANSLATOR_TRACE=1 or debug logging is on.
+        IDs are still GUIDs, but derive from one random base per
+        instance plus a counter, so no per-request randomness is drawn.
+        """
+        if not (_TRACE_ENABLED or logger.isEnabledFor(logging.DEBUG)):
+            return None
+        trace_id = str(uuid.UUID(int=self._trace_base + next(self._trace_seq) % 2**32))
+        logger.debug("Translator request trace id %s", trace_id)
+        return {"X-ClientTraceId": trace_id}
+
+    def close(self) -> None:
+        """Release the pooled connections (they reopen on next use)."""
+        if self._session is not None:
+            self._session.close()
 
     # ------------------------------------------------------------------
     # Public API
@@ -82,11 +406,52 @@ class Translator:
         Returns:
             Translated text string. Returns original text on failure.
         """
-        if not self._initialized:
-            return text
+        return self.translate_batch([text], target_language, source_language)[0]
 
-        if not text or not text.strip():
-            return text
+    async def translate_async(
+        self,
+        text: str,
+        target_language: str = "en",
+        source_language: Optional[str] = None,
+    ) -> str:
+        """translate() without blocking the event loop (runs on a thread)."""
+        return await asyncio.to_thread(self.translate, text, target_language, source_language)
+
+    async def translate_batch_async(
+        self,
+        texts: list[str],
+        target_language: str = "en",
+        source_language: Optional[str] = None,
+    ) -> list[str]:
+        """translate_batch() without blocking the event loop (runs on a thread)."""
+        return await asyncio.to_thread(self.translate_batch, texts, target_language, source_language)
+
+    def translate_batch(
+        self,
+        texts: list[str],
+        target_language: str = "en",
+        source_language: Optional[str] = None,
+    ) -> list[str]:
+        """Translate several texts with as few requests as possible.
+
+        AI-102: The /translate request body is an array of up to 100
+        ``{"text": ...}`` elements, translated in one round trip; the
+        response has one entry per element, in order.
+
+        Args:
+            texts: Texts to translate.
+            target_language: Target language code (e.g. 'en', 'de').
+            source_language: Optional source language code. If None,
+                the service will auto-detect.
+
+        Returns:
+            One translation per input, in order. Blank texts are returned
+            unchanged, as is every text of a request that fails. Results
+            are cached, so repeated texts are sent at most once.
+        """
+        results = list(texts)
+        if not self._initialized:
+            return results
 
         # Extract base language code from locale (e.g. 'de-DE' -> 'de')
         target_lang = target_language.split("-")[0]
@@ -94,10 +459,95 @@ class Translator:
 
         # Skip if same language
         if source_lang and source_lang == target_lang:
-            return text
+            return results
+
+        # Cache hits are filled in directly; each distinct miss is sent once
+        misses: dict[str, list[int]] = {}
+        for i, text in enumerate(texts):
+            if not text or not text.strip():
+                continue
+            if _untranslatable(text):
+                continue
+            if source_lang is None and _local_language(text) == target_lang:
+                continue  # already in the target language
+            cached = (
+                _cache_get(_cache_key(text, source_lang, target_lang))
+                if len(text) <= _CACHE_MAX_CHARS else None
+            )
+            if cached is not None:
+                results[i] = cached
+            else:
+                misses.setdefault(text, []).append(i)
+
+        pending = list(misses)
+        for start in range(0, len(pending), _MAX_BATCH_ELEMENTS):
+            chunk = pending[start:start + _MAX_BATCH_ELEMENTS]
+            translated = self._translate_chunk(chunk, target_lang, source_lang)
+            if translated is None:
+                continue
+            for text, translation in zip(chunk, translated):
+                for i in misses[text]:
+                    results[i] = translation
+            _cache_put([
+                (_cache_key(text, source_lang, target_lang), translation)
+                for text, translation in zip(chunk, translated)
+                if len(text) <= _CACHE_MAX_CHARS
+            ])
+        return results
+
+    def translate_many(
+        self,
+        items: list[tuple[str, str]],
+        source_language: Optional[str] = None,
+    ) -> list[str]:
+        """Translate texts bound for different target languages.
+
+        Texts sharing a target language are batched into one request (a
+        /translate call has a single ``to``), and the per-language
+        requests run concurrently, so total latency is about one round
+        trip rather than one per language.
+
+        Args:
+            items: ``(text, target_language)`` pairs.
+            source_language: Optional source language code. If None,
+                the service will auto-detect.
+
+        Returns:
+            One translation per pair, in input order.
+        """
+        groups: dict[str, list[int]] = {}
+        for i, (_, target) in enumerate(items):
+            groups.setdefault(target, []).append(i)
+
+        def run(target: str) -> list[str]:
+            return self.translate_batch(
+                [items[i][0] for i in groups[target]], target, source_language
+            )
 
+        if len(groups) < 2 or not self._initialized:
+            translated = [run(target) for target in groups]
+        else:
+            with ThreadPoolExecutor(max_workers=min(_MAX_FAN_OUT, len(groups))) as pool:
+                translated = list(pool.map(run, groups))
+
+        results = [text for text, _ in items]
+        for indices, texts in zip(groups.values(), translated):
+            for i, text in zip(indices, texts):
+                results[i] = text
+        return results
+
+    def _translate_chunk(
+        self,
+        texts: list[str],
+        target_lang: str,
+        source_lang: Optional[str],
+    ) -> Optional[list[str]]:
+        """One /translate request for at most _MAX_BATCH_ELEMENTS texts.
+
+        Returns:
+            Translations in input order, or ``None`` on failure.
+        """
         try:
-            url = f"{self.endpoint.rstrip('/')}/translate"
             params: dict = {
                 "api-version": "3.0",
                 "to": target_lang,
@@ -105,37 +555,32 @@ class Translator:
             if source_lang:
                 params["from"] = source_lang
 
-            headers = {
-                "Ocp-Apim-Subscription-Key": self.key,
-                "Ocp-Apim-Subscription-Region": self.region,
-                "Content-type": "application/json",
-                "X-ClientTraceId": str(uuid.uuid4()),
-            }
-
-            body = [{"text": text}]
-
-            response = requests.post(
-                url, params=params, headers=headers, json=body, timeout=10
-            )
-            response.raise_for_status()
-            result = response.json()
-
-            translated_text = result[0]["translations"][0]["text"]
-            logger.info(
-                "Translated '%s...' → '%s...' (%s→%s)",
-                text[:30],
-                translated_text[:30],
-                source_lang or "auto",
-                target_lang,
-            )
-            return translated_text
+            body = _json_dumps([{"text": text} for text in texts])
+
+            result = self._post(self._translate_url, params, body)
+
+            translated = [item["translations"][0]["text"] for item in result]
+            if len(translated) != len(texts):
+                raise ValueError(
+                    f"expected {len(texts)} translations, got {len(translated)}"
+                )
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(
+                    "Translated %d text(s), '%s...' → '%s...' (%s→%s)",
+                    len(texts),
+                    texts[0][:30],
+                    translated[0][:30],
+                    source_lang or "auto",
+                    target_lang,
+                )
+            return translated
 
         except requests.RequestException as exc:
             logger.error("Translation HTTP error: %s", exc)
-            return text
-        except (KeyError, IndexError) as exc:
+            return None
+        except (KeyError, IndexError, TypeError, ValueError) as exc:
             logger.error("Translation parse error: %s", exc)
-            return text
+            return None
 
     def detect_language(self, text: str) -> Optional[str]:
         """Detect the language of the given text.
@@ -149,43 +594,73 @@ class Translator:
         Returns:
             Detected language code (e.g. 'de') or ``None``.
         """
-        if not self._initialized or not text.strip():
+        candidates = self.detect_languages(text)
+        if not candidates or candidates[0][0] == _UNDETERMINED:
             return None
+        return candidates[0][0]
 
-        try:
-            url = f"{self.endpoint.rstrip('/')}/detect"
-            params = {"api-version": "3.0"}
-
-            headers = {
-                "Ocp-Apim-Subscription-Key": self.key,
-                "Ocp-Apim-Subscription-Region": self.region,
-                "Content-type": "application/json",
-                "X-ClientTraceId": str(uuid.uuid4()),
-            }
+    def detect_languages(self, text: str) -> list[tuple[str, float]]:
+        """Detect the likely languages of the given text, with scores.
 
-            body = [{"text": text}]
-            response = requests.post(
-                url, params=params, headers=headers, json=body, timeout=10
-            )
-            response.raise_for_status()
-            result = response.json()
+        AI-102: Besides the top language, /detect returns lower-scored
+        ``alternatives``. Mixed-language input ("mein Kopf hurts") spreads
+        the score across several, which the top label alone hides.
+        Candidates are kept, best first, until their scores add up to
+        _DETECT_CUMULATIVE_CUTOFF; whatever is left is reported as
+        ``("und", remainder)``.
 
-            detected = result[0]["language"]
-            confidence = result[0].get("score", 0)
-            logger.info(
-                "Detected language: %s (confidence=%.2f)", detected, confidence
-            )
-            return detected
+        Args:
+            text: Text whose language to detect.
+
+        Returns:
+            ``(language_code, score)`` pairs, highest score first, or an
+            empty list if detection is unavailable or fails.
+        """
+        if not self._initialized or not text.strip():
+            return []
+
+        try:
+            body = _json_dumps([{"text": text}])
+            result = self._post(self._detect_url, _DETECT_PARAMS, body)
+
+            primary = result[0]
+            scored = [(primary["language"], float(primary.get("score", 0)))]
+            scored += [
+                (alt["language"], float(alt.get("score", 0)))
+                for alt in primary.get("alternatives", [])
+            ]
+            scored.sort(key=lambda pair: pair[1], reverse=True)
+
+            candidates = []
+            total = 0.0
+            for language, score in scored:
+                candidates.append((language, score))
+                total += score
+                if total >= _DETECT_CUMULATIVE_CUTOFF:
+                    break
+            remainder = round(1.0 - total, 4)
+            if remainder > 0:
+                candidates.append((_UNDETERMINED, remainder))
+
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(
+                    "Detected language: %s (confidence=%.2f)", *candidates[0]
+                )
+            return candidates
 
         except Exception as exc:
             logger.error("Language detection error: %s", exc)
-            return None
+            return []
 
     def translate_to_english(
         self, text: str, source_language: Optional[str] = None
     ) -> str:
         """Convenience method: translate patient text to English for backend.
 
+        Pass the language Speech recognition already detected (its
+        ``language`` or ``language_code``) as ``source_language``; the
+        service's own auto-detection is only a fallback for typed input.
+
         Args:
             text: Patient text in any language.
             source_language: Detected language code.
@@ -205,4 +680,16 @@ class Translator:
         Returns:
             Translated text in the patient's language.
         """
-        return self.translate(text, target_language=target_language, source_language="en")
\ No newline at end of file
+        return self.translate(text, target_language=target_language, source_language="en")
+
+    def translate_many_from_english(self, texts: list[str], target_language: str) -> list[str]:
+        """Translate several English backend texts in one request.
+
+        Args:
+            texts: English texts from the backend.
+            target_language: Patient's detected language code.
+
+        Returns:
+            Translations in the patient's language, in input order.
+        """
+        return self.translate_batch(texts, target_language=target_language, source_language="en")
\ No newline at end of file
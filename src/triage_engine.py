@@ -15,23 +15,49 @@ AI-102 Concepts:
 
 from __future__ import annotations
 
+import asyncio
+import atexit
+import functools
+import importlib.util
 import json
 import logging
 import os
-from datetime import datetime, timezone
-from typing import Any, Optional
-from uuid import uuid4
+import re
+import secrets
+import threading
+import weakref
+from collections import OrderedDict
+from datetime import datetime, timedelta, timezone
+from string import Template
+from typing import Any, Iterator, Literal, Optional
 
 from dotenv import load_dotenv
+from pydantic import BaseModel
+
+try:
+    import orjson
+    _json_loads = orjson.loads
+    _json_dumps = orjson.dumps
+except ImportError:
+    _json_loads = json.loads
+
+    def _json_dumps(obj) -> bytes:
+        return json.dumps(obj, ensure_ascii=False).encode("utf-8")
 
-load_dotenv()
 logger = logging.getLogger(__name__)
 
+# .env is read on first TriageEngine construction, not at import, so tools
+# that only use the constants or helpers here never touch the disk for it
+_ENV_LOADED = False
+
 # Triage level constants
 TRIAGE_EMERGENCY = "EMERGENCY"
 TRIAGE_URGENT = "URGENT"
 TRIAGE_ROUTINE = "ROUTINE"
 
+# Valid values for an assessment's triage_level
+_TRIAGE_LEVELS = frozenset({TRIAGE_EMERGENCY, TRIAGE_URGENT, TRIAGE_ROUTINE})
+
 TRIAGE_COLORS = {
     TRIAGE_EMERGENCY: "🔴",
     TRIAGE_URGENT: "🟠",
@@ -44,6 +70,314 @@ TRIAGE_DESCRIPTIONS = {
     TRIAGE_ROUTINE: "Non-urgent, can wait or self-care",
 }
 
+# Max concurrent completions in batch_assess_triage()
+_BATCH_CONCURRENCY = 10
+# Max RAG retrieval results kept per engine
+_CONTEXT_CACHE_MAX = 512
+
+# System prompt skeletons; only the knowledge section varies per call
+_QUESTION_PROMPT = Template("""You are an emergency medical triage AI assistant. Your role is to
+ask focused, condition-specific follow-up questions to assess the severity of a patient's condition.
+
+${knowledge_section}
+
+RULES:
+1. Generate 3-5 focused follow-up questions SPECIFIC to this exact complaint.
+2. Use the patient demographics to adapt questions to their risk profile.
+   - Males 45+: prioritise cardiac red flags
+   - Females 18-44: consider gynaecological causes for abdominal pain
+   - Under 18: consider paediatric presentations and doses
+   - 75+: consider falls, polypharmacy, atypical presentations
+3. Questions must help determine triage level: EMERGENCY, URGENT, or ROUTINE.
+4. Prioritise RED FLAG assessment questions first.
+5. Keep questions simple — the patient may be in distress.
+6. Do NOT ask age or sex (already collected). Do NOT repeat previous answers.
+7. Questions must be SPECIFIC to the complaint — not generic.
+
+CRITICAL OUTPUT RULES — MUST FOLLOW:
+- NEVER use type "free_text". The patient cannot type — they are in distress.
+- Every single question MUST have a non-empty "options" list with 2-6 clickable choices.
+- For time questions use options like: ["Just now", "Less than 1 hour", "1-6 hours", "6-24 hours", "More than 1 day"]
+- For onset questions use: ["Suddenly", "Gradually over minutes", "Gradually over hours", "Gradually over days"]
+- For location questions use specific anatomical options.
+- For severity always use scale type with options ["1","2","3","4","5","6","7","8","9","10"].
+- Allowed types: "yes_no", "scale", "multiple_choice" ONLY.
+
+OUTPUT FORMAT (strict JSON):
+{
+  "questions": [
+    {
+      "question": "Does the pain radiate to your arm, jaw, or back?",
+      "type": "yes_no",
+      "options": ["Yes", "No"],
+      "clinical_rationale": "Assessing for cardiac radiation pattern"
+    },
+    {
+      "question": "Rate your pain on a scale of 1-10",
+      "type": "scale",
+      "options": ["1", "2", "3", "4", "5", "6", "7", "8", "9", "10"],
+      "clinical_rationale": "Pain severity assessment"
+    },
+    {
+      "question": "When did the pain start?",
+      "type": "multiple_choice",
+      "options": ["Just now", "Less than 1 hour ago", "1-6 hours ago", "6-24 hours ago", "More than 1 day ago"],
+      "clinical_rationale": "Onset timing for urgency assessment"
+    },
+    {
+      "question": "Do you have any of these symptoms?",
+      "type": "multiple_choice",
+      "options": ["Sweating", "Shortness of breath", "Nausea", "Dizziness", "None"],
+      "clinical_rationale": "Checking for associated cardiac symptoms"
+    }
+  ]
+}
+""")
+
+_ASSESSMENT_PROMPT = Template("""You are an emergency medical triage AI. Analyze the patient's
+symptoms and answers to determine the appropriate triage level.
+
+${knowledge_section}
+
+ASSESSMENT RULES:
+1. Identify ALL red flags present.
+2. Classify into: EMERGENCY, URGENT, or ROUTINE.
+3. Provide a clear assessment summary.
+4. Recommend specific actions.
+
+OUTPUT FORMAT (strict JSON):
+{
+  "triage_level": "EMERGENCY|URGENT|ROUTINE",
+  "assessment": "Brief clinical assessment summary",
+  "red_flags": ["list", "of", "identified", "red", "flags"],
+  "recommended_action": "What the patient should do",
+  "risk_score": 8,
+  "source_guidelines": ["guideline sources used, or empty list if none"],
+  "suspected_conditions": ["possible conditions"],
+  "time_sensitivity": "How urgent (e.g., 'Seek ER within 10 minutes')"
+}
+""")
+
+# ---------------------------------------------------------------------------
+# Structured-output schemas for the realtime completions. The service
+# enforces them server-side, so replies always parse.
+# ---------------------------------------------------------------------------
+class Question(BaseModel):
+    """One clickable follow-up question."""
+
+    question: str
+    type: Literal["yes_no", "scale", "multiple_choice"]
+    options: list[str]
+    clinical_rationale: str
+
+
+class QuestionSet(BaseModel):
+    """Reply schema for generate_questions()."""
+
+    questions: list[Question]
+
+
+class TriageAssessment(BaseModel):
+    """Reply schema for assess_triage()."""
+
+    triage_level: Literal["EMERGENCY", "URGENT", "ROUTINE"]
+    assessment: str
+    red_flags: list[str]
+    recommended_action: str
+    risk_score: int
+    source_guidelines: list[str]
+    suspected_conditions: list[str]
+    time_sensitivity: str
+
+
+def _unsupported_schema(exc: Exception) -> bool:
+    """True when a request failed because json_schema output is unsupported."""
+    message = str(exc).lower()
+    return getattr(exc, "status_code", None) == 400 and (
+        "response_format" in message or "json_schema" in message
+    )
+
+
+# Closes as soon as the model has emitted the triage level in a streamed reply
+_TRIAGE_LEVEL_FIELD = re.compile(r'"triage_level"\s*:\s*"(EMERGENCY|URGENT|ROUTINE)"')
+
+
+@functools.lru_cache(maxsize=128)
+def _system_prompt(template: Template, knowledge_section: str) -> str:
+    """Render a prompt template with its knowledge section.
+
+    Follow-up turns for the same complaint retrieve the same guidelines,
+    so the rendered prompt text is reused.
+    """
+    return template.substitute(knowledge_section=knowledge_section)
+
+
+# Cases packed into one completion by assess_triage_batch(). Each case gets
+# _TOKENS_PER_CASE of reply budget (~300 used), and the total is capped at
+# _MAX_BATCH_COMPLETION_TOKENS so a group always fits the deployment limit.
+_CASES_PER_CALL = 10
+_TOKENS_PER_CASE = 400
+_MAX_BATCH_COMPLETION_TOKENS = 4096
+
+_MULTI_CASE_PROMPT = """You are an emergency medical triage AI. You will receive several
+independent patient cases, each headed "=== CASE <n> ===". Assess every case on
+its own, ignoring the others.
+
+KNOWLEDGE SOURCE: General medical knowledge. Set source_guidelines to an empty list [].
+
+ASSESSMENT RULES:
+1. Identify ALL red flags present.
+2. Classify into: EMERGENCY, URGENT, or ROUTINE.
+3. Provide a clear assessment summary.
+4. Recommend specific actions.
+
+OUTPUT FORMAT (strict JSON, one entry per case):
+{
+  "assessments": [
+    {
+      "case_index": 0,
+      "triage_level": "EMERGENCY|URGENT|ROUTINE",
+      "assessment": "Brief clinical assessment summary",
+      "red_flags": ["list", "of", "identified", "red", "flags"],
+      "recommended_action": "What the patient should do",
+      "risk_score": 8,
+      "source_guidelines": [],
+      "suspected_conditions": ["possible conditions"],
+      "time_sensitivity": "How urgent (e.g., 'Seek ER within 10 minutes')"
+    }
+  ]
+}
+"""
+
+# Retries after the first attempt. The openai SDK backs off exponentially
+# with jitter (honouring Retry-After) on 408/409/429/5xx, timeouts and
+# connection errors before a call falls back to the mock path.
+# AZURE_OPENAI_MAX_RETRIES overrides the default.
+_OPENAI_MAX_RETRIES = 2
+
+
+def _env_max_retries() -> int:
+    """AZURE_OPENAI_MAX_RETRIES as a non-negative int, else the default."""
+    raw = os.getenv("AZURE_OPENAI_MAX_RETRIES", "").strip()
+    if not raw:
+        return _OPENAI_MAX_RETRIES
+    try:
+        value = int(raw)
+    except ValueError:
+        value = -1
+    if value < 0:
+        logger.warning(
+            "Ignoring invalid AZURE_OPENAI_MAX_RETRIES=%r; using %d.",
+            raw, _OPENAI_MAX_RETRIES,
+        )
+        return _OPENAI_MAX_RETRIES
+    return value
+
+
+# RAG context budget per prompt. Tokens are estimated at ~4 characters each
+# (GPT-4 average for English prose); no tokenizer is shipped with the app.
+_CONTEXT_TOKEN_BUDGET = 1500
+_CHARS_PER_TOKEN = 4
+
+
+def _fit_context(contents: list[str], budget_tokens: int = _CONTEXT_TOKEN_BUDGET) -> list[str]:
+    """Shrink every chunk by the same factor so together they fit the budget.
+
+    Prompt latency and cost grow with prompt length, and three full
+    guideline chunks can be several thousand tokens. Cuts fall on a
+    word boundary.
+    """
+    budget_chars = budget_tokens * _CHARS_PER_TOKEN
+    total = sum(len(c) for c in contents)
+    if total <= budget_chars:
+        return contents
+
+    keep = budget_chars / total
+    fitted = []
+    for content in contents:
+        cut = content[:int(len(content) * keep)]
+        if len(cut) < len(content):
+            cut = (cut.rsplit(" ", 1)[0] if " " in cut else cut) + " …"
+        fitted.append(cut)
+    return fitted
+
+
+# Process-wide sync HTTP client shared by every TriageEngine (created on
+# first use). httpx.AsyncClient pools are bound to the loop they first ran
+# on, so async clients are kept one per running event loop instead.
+_HTTP_CLIENT: Optional[Any] = None
+_ASYNC_HTTP_CLIENTS: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+_HTTP_CLIENTS_LOCK = threading.Lock()
+
+
+def _http_settings() -> dict[str, Any]:
+    """Timeout, pool limits and HTTP/2 flag shared by both client flavours."""
+    import httpx
+
+    return {
+        "timeout": httpx.Timeout(60.0, connect=5.0),
+        "limits": httpx.Limits(max_connections=50, max_keepalive_connections=20),
+        # HTTP/2 is used when the optional ``h2`` package is installed
+        "http2": importlib.util.find_spec("h2") is not None,
+    }
+
+
+def _shared_http_client() -> Any:
+    """Return the shared sync httpx client for Azure OpenAI.
+
+    One keep-alive pool means engines created later (or in parallel)
+    reuse warm TCP/TLS connections instead of handshaking again.
+    """
+    global _HTTP_CLIENT
+    with _HTTP_CLIENTS_LOCK:
+        if _HTTP_CLIENT is None:
+            import httpx
+
+            settings = _http_settings()
+            _HTTP_CLIENT = httpx.Client(
+                timeout=settings["timeout"],
+                transport=httpx.HTTPTransport(
+                    retries=2, http2=settings["http2"], limits=settings["limits"]
+                ),
+            )
+        return _HTTP_CLIENT
+
+
+def _loop_http_client() -> Any:
+    """Return the async httpx client for the running event loop.
+
+    Each loop gets its own pool, so a client is never reused after the
+    loop it was opened on has closed (e.g. across asyncio.run() calls).
+    """
+    loop = asyncio.get_running_loop()
+    with _HTTP_CLIENTS_LOCK:
+        client = _ASYNC_HTTP_CLIENTS.get(loop)
+        if client is None:
+            import httpx
+
+            settings = _http_settings()
+            client = httpx.AsyncClient(
+                timeout=settings["timeout"],
+                transport=httpx.AsyncHTTPTransport(
+                    retries=2, http2=settings["http2"], limits=settings["limits"]
+                ),
+            )
+            _ASYNC_HTTP_CLIENTS[loop] = client
+        return client
+
+
+@atexit.register
+def _close_http_clients() -> None:
+    """Close the shared pools at interpreter exit."""
+    if _HTTP_CLIENT is not None:
+        _HTTP_CLIENT.close()
+    for loop, client in list(_ASYNC_HTTP_CLIENTS.items()):
+        # A closed loop has already torn down its sockets; an idle one
+        # can still run aclose() to shut the pool down cleanly.
+        if not loop.is_closed() and not loop.is_running():
+            loop.run_until_complete(client.aclose())
+
+
 # ---------------------------------------------------------------------------
 # Demographic intake questions — always asked first before AI clinical questions.
 # Answers are injected into the GPT-4 prompt so the model can adapt questions
@@ -67,6 +401,303 @@ DEMOGRAPHIC_QUESTIONS: list[dict] = [
 ]
 
 
+class _KeywordScanner:
+    """Finds which keyword groups occur in a text in a single regex pass.
+
+    ``tags(text)`` equals ``{g for g, kws in groups.items()
+    if any(kw in text for kw in kws)}``: every keyword is one branch of a
+    zero-width lookahead, so matches at every offset are seen, and each
+    keyword carries the tags of all keywords that are prefixes of it
+    (the alternation only reports the longest keyword at an offset).
+    """
+
+    def __init__(self, groups: dict[str, tuple[str, ...]]) -> None:
+        owners: dict[str, set[str]] = {}
+        for tag, keywords in groups.items():
+            for kw in keywords:
+                owners.setdefault(kw, set()).add(tag)
+        self._tags = {
+            kw: frozenset().union(*(t for k, t in owners.items() if kw.startswith(k)))
+            for kw in owners
+        }
+        branches = sorted(owners, key=len, reverse=True)
+        self._pattern = re.compile("(?=(%s))" % "|".join(map(re.escape, branches)))
+
+    def tags(self, text: str) -> set[str]:
+        """Return the tags of every keyword group found in ``text``."""
+        found: set[str] = set()
+        for match in self._pattern.finditer(text):
+            found |= self._tags[match.group(1)]
+        return found
+
+
+# Multilingual yes / no answers (EN / DE / TR / FR / ES / IT / PT / RU / AR / ZH)
+_AFFIRMATIVE: frozenset[str] = frozenset({
+    "yes", "ja", "evet", "oui", "sí", "si", "sì", "sim", "да", "نعم", "是",
+})
+_NEGATIVE: frozenset[str] = frozenset({
+    "no", "nein", "hayır", "non", "não", "нет", "لا", "否",
+})
+
+# Chief-complaint keywords used by _mock_assessment(). Matched as substrings
+# ("palpitat", "wheez", "stroke" in "heatstroke"), all in one scan.
+_CARDIAC_COMPLAINT_KW = ("chest", "heart", "cardiac", "palpitat")
+_STROKE_COMPLAINT_KW = (
+    "stroke", "slurred", "speech", "face droop", "arm weakness",
+    "can't move", "sudden weakness", "facial",
+)
+_RESPIRATORY_COMPLAINT_KW = ("breath", "asthma", "wheez", "cough", "lung", "inhaler")
+_ABDOMINAL_COMPLAINT_KW = ("stomach", "abdom", "belly", "vomit", "nausea", "appendix")
+_DIABETIC_COMPLAINT_KW = ("diabet", "sugar", "insulin", "glucose", "hypoglycemi")
+_EMERGENCY_COMPLAINT_KW = (
+    "chest pain", "heart attack", "stroke", "unconscious",
+    "can't breathe", "seizure", "arm weakness", "face droop",
+    "can't move", "slurred",
+)
+_URGENT_COMPLAINT_KW = (
+    "pain", "fever", "vomiting", "broken", "injury",
+    "fall", "cough", "stomach",
+)
+_COMPLAINT_KEYWORDS = _KeywordScanner({
+    "cardiac": _CARDIAC_COMPLAINT_KW,
+    "stroke": _STROKE_COMPLAINT_KW,
+    "respiratory": _RESPIRATORY_COMPLAINT_KW,
+    "abdominal": _ABDOMINAL_COMPLAINT_KW,
+    "diabetic": _DIABETIC_COMPLAINT_KW,
+    "emergency": _EMERGENCY_COMPLAINT_KW,
+    "urgent": _URGENT_COMPLAINT_KW,
+})
+
+# Question keywords used by _mock_assessment(), grouped by clinical intent
+_QUESTION_KEYWORDS = _KeywordScanner({
+    "radiation": ("radiat", "jaw", "back"),
+    "cardiac_history": ("heart disease", "cardiac history"),
+    "prior_heart": ("prior heart",),
+    "sudden": ("sudden", "suddenly", "plötzlich", "aniden"),
+    "speech": ("slur", "slurred", "unclear speech"),
+    "face": ("smile", "face", "symmetr", "both sides"),
+    "arm_raise": ("raise", "lift both", "arms equally"),
+    "fever": ("fever", "fieber", "ateş", "temperature"),
+    "blood": ("blood", "blut", "bleeding", "bleed"),
+    "chronic": ("chronic", "condition", "medical condition"),
+    "mental_status": ("confused", "drowsy", "unconscious", "altered"),
+    "sentence": ("sentence", "complete a", "breathe without"),
+})
+
+# Multi-choice symptom keywords (EN / DE / TR / FR / ES / IT / PT / RU / AR)
+_ANSWER_KEYWORDS = _KeywordScanner({
+    "sweating": (
+        "sweating", "schwitzen", "terleme", "transpiration",
+        "sudoración", "sudorazione", "suor", "потоотделение", "تعرق",
+    ),
+    "dyspnea": (
+        "shortness", "breath", "atemnot", "nefes", "essoufflement",
+        "dificultad respirar", "mancanza di fiato", "falta de ar",
+        "одышка", "ضيق التنفس",
+    ),
+    "nausea": (
+        "nausea", "übelkeit", "bulantı", "nausée", "náuseas",
+        "náusea", "тошнота", "غثيان",
+    ),
+    "dizziness": (
+        "dizz", "schwindel", "baş dönmesi", "vertige", "mareo",
+        "vertigine", "tontura", "головокружение", "دوار",
+    ),
+    "vomiting": (
+        "vomit", "erbrechen", "kusma", "vomissement", "vómito",
+        "vomito", "vômito", "рвота", "قيء",
+    ),
+    "fever": (
+        "fever", "fieber", "ateş", "fièvre", "fiebre", "febbre",
+        "febre", "лихорадка", "حمى",
+    ),
+    "blood": (
+        "blood", "blut", "kan", "sang", "sangre", "sangue",
+        "кровь", "دم",
+    ),
+    "lower_right": ("lower right",),
+    "diffuse": ("all over", "diffuse"),
+})
+
+
+# ---------------------------------------------------------------------------
+# Canned follow-up questions used by _mock_questions() when Azure OpenAI is
+# unavailable, routed by keyword topic of the chief complaint.
+# ---------------------------------------------------------------------------
+_CARDIAC_QUESTIONS: list[dict] = [
+    {
+        "question": "Does the pain radiate to your arm, jaw, or back?",
+        "type": "yes_no",
+        "options": ["Yes", "No"],
+        "clinical_rationale": "Cardiac radiation pattern",
+    },
+    {
+        "question": "Rate your pain on a scale of 1-10",
+        "type": "scale",
+        "options": [str(i) for i in range(1, 11)],
+        "clinical_rationale": "Pain severity",
+    },
+    {
+        "question": "Do you have any of these symptoms?",
+        "type": "multiple_choice",
+        "options": ["Sweating", "Shortness of breath", "Nausea", "Dizziness", "None"],
+        "clinical_rationale": "Associated symptoms",
+    },
+    {
+        "question": "Do you have a history of heart disease?",
+        "type": "yes_no",
+        "options": ["Yes", "No"],
+        "clinical_rationale": "Cardiac history",
+    },
+]
+
+_NEURO_QUESTIONS: list[dict] = [
+    {
+        "question": "Did symptoms start suddenly?",
+        "type": "yes_no",
+        "options": ["Yes", "No"],
+        "clinical_rationale": "Sudden onset assessment",
+    },
+    {
+        "question": "Can you smile with both sides of your face?",
+        "type": "yes_no",
+        "options": ["Yes", "No"],
+        "clinical_rationale": "FAST - Face assessment",
+    },
+    {
+        "question": "Can you raise both arms equally?",
+        "type": "yes_no",
+        "options": ["Yes", "No"],
+        "clinical_rationale": "FAST - Arms assessment",
+    },
+    {
+        "question": "Is your speech slurred or unclear?",
+        "type": "yes_no",
+        "options": ["Yes", "No"],
+        "clinical_rationale": "FAST - Speech assessment",
+    },
+]
+
+_ABDOMINAL_QUESTIONS: list[dict] = [
+    {
+        "question": "Where exactly is the pain?",
+        "type": "multiple_choice",
+        "options": ["Upper right", "Upper left", "Lower right", "Lower left", "Central", "All over"],
+        "clinical_rationale": "Pain localization for differential diagnosis",
+    },
+    {
+        "question": "Rate your pain on a scale of 1-10",
+        "type": "scale",
+        "options": [str(i) for i in range(1, 11)],
+        "clinical_rationale": "Pain severity assessment",
+    },
+    {
+        "question": "Do you have any of these symptoms?",
+        "type": "multiple_choice",
+        "options": ["Fever", "Vomiting", "Diarrhea", "Blood in stool", "None"],
+        "clinical_rationale": "Associated GI symptoms",
+    },
+    {
+        "question": "Was the onset sudden or gradual?",
+        "type": "yes_no",
+        "options": ["Sudden", "Gradual"],
+        "clinical_rationale": "Onset pattern for surgical vs medical cause",
+    },
+]
+
+_RESPIRATORY_QUESTIONS: list[dict] = [
+    {
+        "question": "Can you complete a full sentence without stopping to breathe?",
+        "type": "yes_no",
+        "options": ["Yes", "No"],
+        "clinical_rationale": "Severity of respiratory distress",
+    },
+    {
+        "question": "When did the breathing difficulty start?",
+        "type": "multiple_choice",
+        "options": ["Just now", "Hours ago", "Days ago", "Ongoing"],
+        "clinical_rationale": "Onset timing",
+    },
+    {
+        "question": "Do you have asthma, COPD, or any lung disease?",
+        "type": "yes_no",
+        "options": ["Yes", "No"],
+        "clinical_rationale": "Respiratory history",
+    },
+    {
+        "question": "Were you exposed to anything before this started?",
+        "type": "multiple_choice",
+        "options": ["Allergen", "Smoke/fumes", "Cold air", "Exercise", "Nothing specific"],
+        "clinical_rationale": "Trigger identification",
+    },
+]
+
+_DIABETIC_QUESTIONS: list[dict] = [
+    {
+        "question": "Do you have diabetes? What type?",
+        "type": "multiple_choice",
+        "options": ["Type 1", "Type 2", "Not sure", "No diabetes"],
+        "clinical_rationale": "Diabetes classification",
+    },
+    {
+        "question": "What is your blood sugar if known?",
+        "type": "multiple_choice",
+        "options": ["Below 70 mg/dL", "70-180 mg/dL", "180-300 mg/dL", "Above 300 mg/dL", "Don't know"],
+        "clinical_rationale": "Glucose level assessment",
+    },
+    {
+        "question": "Do you have nausea, vomiting, or abdominal pain?",
+        "type": "yes_no",
+        "options": ["Yes", "No"],
+        "clinical_rationale": "DKA symptom check",
+    },
+    {
+        "question": "Are you feeling confused or drowsy?",
+        "type": "yes_no",
+        "options": ["Yes", "No"],
+        "clinical_rationale": "Altered mental status assessment",
+    },
+]
+
+_GENERIC_QUESTIONS: list[dict] = [
+    {
+        "question": "When did the symptoms start?",
+        "type": "multiple_choice",
+        "options": ["Just now", "Hours ago", "Days ago", "Weeks ago"],
+        "clinical_rationale": "Onset timing",
+    },
+    {
+        "question": "Rate your discomfort on a scale of 1-10",
+        "type": "scale",
+        "options": [str(i) for i in range(1, 11)],
+        "clinical_rationale": "Severity assessment",
+    },
+    {
+        "question": "Do you have any chronic medical conditions?",
+        "type": "yes_no",
+        "options": ["Yes", "No"],
+        "clinical_rationale": "Medical history",
+    },
+]
+
+_COMPLAINT_TOPICS = _KeywordScanner({
+    "cardiac": ("chest", "heart", "cardiac"),
+    "neuro": ("head", "stroke", "face", "speech"),
+    "abdominal": ("stomach", "abdom", "belly", "vomit", "nausea"),
+    "respiratory": ("breath", "asthma", "wheez", "cough", "lung"),
+    "diabetic": ("diabet", "sugar", "insulin", "glucose"),
+})
+
+# First matching topic wins
+_MOCK_QUESTION_ROUTES: tuple[tuple[str, list[dict]], ...] = (
+    ("cardiac", _CARDIAC_QUESTIONS),
+    ("neuro", _NEURO_QUESTIONS),
+    ("abdominal", _ABDOMINAL_QUESTIONS),
+    ("respiratory", _RESPIRATORY_QUESTIONS),
+    ("diabetic", _DIABETIC_QUESTIONS),
+)
+
+
 class TriageEngine:
     """AI-powered medical triage engine with RAG grounding.
 
@@ -93,11 +724,21 @@ class TriageEngine:
             knowledge_indexer: Optional KnowledgeIndexer instance.
             translator: Optional Translator instance.
         """
+        global _ENV_LOADED
+        if not _ENV_LOADED:
+            load_dotenv()
+            _ENV_LOADED = True
+
         self.openai_client = None
+        self._async_settings: Optional[dict[str, Any]] = None
+        self._async_clients: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
         self.deployment: str = os.getenv("GPT_DEPLOYMENT", "gpt-4")
         self.knowledge_indexer = knowledge_indexer
         self.translator = translator
         self._initialized = False
+        self._structured_outputs = True
+        self._ctx_cache: OrderedDict[str, tuple[str, bool]] = OrderedDict()
+        self._ctx_lock = threading.Lock()
         self._init_openai()
 
     def _init_openai(self) -> None:
@@ -109,6 +750,7 @@ class TriageEngine:
         endpoint = os.getenv("AZURE_OPENAI_ENDPOINT", "")
         key = os.getenv("AZURE_OPENAI_KEY", "")
         api_version = os.getenv("AZURE_OPENAI_API_VERSION", "2024-12-01-preview")
+        max_retries = _env_max_retries()
 
         if not endpoint or not key or key == "your-key":
             logger.warning(
@@ -120,31 +762,52 @@ class TriageEngine:
         try:
             from openai import AzureOpenAI
 
-            # Newer openai SDK versions (≥1.50) removed the 'proxies' kwarg.
-            # If the environment has HTTP_PROXY / HTTPS_PROXY set, the SDK
-            # may fail.  We catch that and create the client with an explicit
-            # httpx client that respects system proxy settings.
-            try:
-                self.openai_client = AzureOpenAI(
-                    azure_endpoint=endpoint,
-                    api_key=key,
-                    api_version=api_version,
-                )
-            except TypeError:
-                import httpx
-
-                self.openai_client = AzureOpenAI(
-                    azure_endpoint=endpoint,
-                    api_key=key,
-                    api_version=api_version,
-                    http_client=httpx.Client(),
-                )
+            # Passing our own httpx clients also sidesteps the removed
+            # 'proxies' kwarg in newer SDKs; httpx honours HTTP(S)_PROXY.
+            http_client = _shared_http_client()
+            self.openai_client = AzureOpenAI(
+                azure_endpoint=endpoint,
+                api_key=key,
+                api_version=api_version,
+                http_client=http_client,
+                timeout=http_client.timeout,
+                max_retries=max_retries,
+            )
+            # The AsyncAzureOpenAI client is built per event loop on first
+            # use (see _async_openai); only its settings are kept here.
+            self._async_settings = {
+                "azure_endpoint": endpoint,
+                "api_key": key,
+                "api_version": api_version,
+                "max_retries": max_retries,
+            }
 
             self._initialized = True
             logger.info("Azure OpenAI client initialized (deployment=%s).", self.deployment)
         except Exception as exc:
             logger.error("Failed to init Azure OpenAI client: %s", exc)
 
+    def _async_openai(self):
+        """Return this engine's AsyncAzureOpenAI client for the running loop.
+
+        AI-102: Async SDK clients hold a connection pool tied to one event
+        loop, so each loop (e.g. each asyncio.run() call) gets its own
+        client over that loop's shared httpx pool.
+        """
+        loop = asyncio.get_running_loop()
+        client = self._async_clients.get(loop)
+        if client is None:
+            from openai import AsyncAzureOpenAI
+
+            http_client = _loop_http_client()
+            client = AsyncAzureOpenAI(
+                **self._async_settings,
+                http_client=http_client,
+                timeout=http_client.timeout,
+            )
+            self._async_clients[loop] = client
+        return client
+
     # ------------------------------------------------------------------
     # RAG: Retrieve context from knowledge base
     # ------------------------------------------------------------------
@@ -169,26 +832,71 @@ class TriageEngine:
         if self.knowledge_indexer is None:
             return "", False
 
+        # Question generation and assessment search the same complaint
+        cache_key = " ".join(query.lower().split())
+        cached = self._ctx_cache_get(cache_key)
+        if cached is not None:
+            return cached
+
         try:
             results = self.knowledge_indexer.search(query, top=3)
             if not results:
                 logger.info("RAG: no results for query '%s' — AI will use general knowledge.", query[:60])
+                self._ctx_cache_put(cache_key, ("", False))
                 return "", False
 
+            # Long guideline chunks are trimmed to the prompt's context budget
+            contents = _fit_context([r.get("content", "") for r in results])
             context_parts = []
-            for r in results:
+            for r, content in zip(results, contents):
                 context_parts.append(
                     f"--- Source: {r.get('source', 'Unknown')} ---\n"
-                    f"{r.get('content', '')}\n"
+                    f"{content}\n"
                 )
             context_text = "\n".join(context_parts)
-            logger.info("RAG: found %d result(s) for query '%s'.", len(results), query[:60])
+            logger.info(
+                "RAG: found %d result(s) for query '%s' (~%d tokens).",
+                len(results), query[:60], len(context_text) // _CHARS_PER_TOKEN,
+            )
+            self._ctx_cache_put(cache_key, (context_text, True))
             return context_text, True
 
         except Exception as exc:
             logger.error("RAG retrieval error: %s", exc)
             return "", False
 
+    async def _aretrieve_context(self, query: str) -> tuple[str, bool]:
+        """Async _retrieve_context(): only a cache miss leaves the event loop.
+
+        The Azure AI Search client is synchronous, so a miss runs on a
+        worker thread while the loop keeps serving other patients.
+        """
+        if self.knowledge_indexer is not None:
+            cached = self._ctx_cache_get(" ".join(query.lower().split()))
+            if cached is not None:
+                return cached
+        return await asyncio.to_thread(self._retrieve_context, query)
+
+    def _ctx_cache_get(self, cache_key: str) -> Optional[tuple[str, bool]]:
+        """Return a cached retrieval result, or None on miss."""
+        with self._ctx_lock:
+            cached = self._ctx_cache.get(cache_key)
+            if cached is not None:
+                self._ctx_cache.move_to_end(cache_key)
+            return cached
+
+    def _ctx_cache_put(self, cache_key: str, value: tuple[str, bool]) -> None:
+        """Store a retrieval result, evicting the least recently used."""
+        with self._ctx_lock:
+            self._ctx_cache[cache_key] = value
+            if len(self._ctx_cache) > _CONTEXT_CACHE_MAX:
+                self._ctx_cache.popitem(last=False)
+
+    def cache_clear(self) -> None:
+        """Drop all cached RAG retrieval results."""
+        with self._ctx_lock:
+            self._ctx_cache.clear()
+
     # ------------------------------------------------------------------
     # Dynamic question generation (Agentic AI)
     # ------------------------------------------------------------------
@@ -218,159 +926,419 @@ class TriageEngine:
             List of question dicts with keys: question, type, options.
             Types: 'yes_no', 'scale', 'multiple_choice', 'free_text'.
         """
+        if not self._initialized:
+            return self._mock_questions(chief_complaint)
+
+        messages = self._question_messages(chief_complaint, previous_answers, demographics)
+
+        try:
+            response = self._chat(messages, QuestionSet)
+            return self._parse_questions(response, chief_complaint)
+
+        except Exception as exc:
+            logger.error("Question generation error: %s", exc)
+            return self._mock_questions(chief_complaint)
+
+    async def agenerate_questions(
+        self,
+        chief_complaint: str,
+        previous_answers: Optional[list[dict]] = None,
+        demographics: Optional[dict] = None,
+    ) -> list[dict]:
+        """Async variant of generate_questions().
+
+        AI-102: AsyncAzureOpenAI lets one event loop keep many completions
+        in flight; the blocking RAG search runs on a worker thread.
+        """
+        if not self._initialized or self._async_settings is None:
+            return self._mock_questions(chief_complaint)
+
+        rag = await self._aretrieve_context(chief_complaint)
+        messages = self._question_messages(
+            chief_complaint, previous_answers, demographics, rag=rag
+        )
+
+        try:
+            response = await self._achat(messages, QuestionSet)
+            return self._parse_questions(response, chief_complaint)
+
+        except Exception as exc:
+            logger.error("Question generation error: %s", exc)
+            return self._mock_questions(chief_complaint)
+
+    def _question_messages(
+        self,
+        chief_complaint: str,
+        previous_answers: Optional[list[dict]],
+        demographics: Optional[dict],
+        rag: Optional[tuple[str, bool]] = None,
+    ) -> list[dict]:
+        """Build the chat messages for question generation.
+
+        ``rag`` is a prefetched _retrieve_context() result; when omitted
+        the knowledge base is searched here.
+        """
         # Retrieve relevant medical guidelines (RAG)
-        context, rag_found = self._retrieve_context(chief_complaint)
+        context, rag_found = rag or self._retrieve_context(chief_complaint)
+
+        # Build demographic context string
+        demo_context = ""
+        if demographics:
+            age   = demographics.get("age_range", "unknown")
+            sex   = demographics.get("sex", "unknown")
+            demo_context = f"\nPATIENT DEMOGRAPHICS: Age range: {age} | Biological sex: {sex}"
+            logger.info("Generating questions with demographics: age=%s sex=%s", age, sex)
+
+        # Build previous answers context
+        answers_context = ""
+        if previous_answers:
+            answers_context = "\nPrevious patient answers:\n" + "".join(
+                f"- Q: {ans.get('question', '')} → A: {ans.get('answer', '')}\n"
+                for ans in previous_answers
+            )
+
+        # AI-102: Adapt system prompt based on RAG availability
+        if rag_found:
+            knowledge_section = f"""MEDICAL GUIDELINES (base your questions on these):
+{context}
+
+Base all questions on the guidelines above."""
+        else:
+            knowledge_section = """KNOWLEDGE SOURCE: General medical knowledge (no specific protocol found in knowledge base).
+Use evidence-based clinical assessment principles for this complaint."""
+
+
+        user_message = (
+            f"Chief complaint: {chief_complaint}"
+            f"{demo_context}"
+            f"{answers_context}"
+            f"\n\nGenerate condition-specific triage assessment questions."
+        )
+        return [
+            {"role": "system", "content": _system_prompt(_QUESTION_PROMPT, knowledge_section)},
+            {"role": "user", "content": user_message},
+        ]
+
+    def _parse_questions(self, response, chief_complaint: str) -> list[dict]:
+        """Extract the question list from a chat completion."""
+        parsed = getattr(response.choices[0].message, "parsed", None)
+        if parsed is not None:
+            questions = [q.model_dump() for q in parsed.questions]
+        else:
+            questions = _json_loads(response.choices[0].message.content).get("questions", [])
+
+        # Grup B: Token usage tracking for cost monitoring (Instruction requirement)
+        usage = getattr(response, "usage", None)
+        if usage:
+            logger.info(
+                "generate_questions — tokens used: prompt=%d completion=%d total=%d",
+                usage.prompt_tokens,
+                usage.completion_tokens,
+                usage.total_tokens,
+            )
+
+        logger.info(
+            "Generated %d questions for: %s", len(questions), chief_complaint[:50]
+        )
+        return questions
+
+    # ------------------------------------------------------------------
+    # Triage assessment
+    # ------------------------------------------------------------------
+
+    def assess_triage(
+        self,
+        chief_complaint: str,
+        answers: list[dict],
+    ) -> dict:
+        """Perform final triage assessment based on all collected information.
+
+        AI-102 (RAG + Generative AI): Combines retrieved medical guidelines
+        with patient answers to produce a grounded triage classification.
+        The model must cite which guidelines informed its decision.
+
+        Args:
+            chief_complaint: Patient's initial complaint in English.
+            answers: All question/answer pairs collected.
+
+        Returns:
+            Assessment dict with triage_level, assessment, red_flags,
+            recommended_action, risk_score, and source_guidelines.
+        """
+        if not self._initialized:
+            return self._mock_assessment(chief_complaint, answers)
+
+        messages = self._assessment_messages(chief_complaint, answers)
+
+        try:
+            response = self._chat(messages, TriageAssessment)
+            return self._parse_assessment(response, chief_complaint)
+
+        except Exception as exc:
+            logger.error("Triage assessment error: %s", exc)
+            return self._mock_assessment(chief_complaint, answers)
+
+    def assess_triage_stream(
+        self,
+        chief_complaint: str,
+        answers: list[dict],
+    ) -> Iterator[dict]:
+        """Stream a triage assessment, yielding the level as soon as it arrives.
+
+        AI-102: With stream=True the completion arrives as token deltas.
+        The first dict yielded is ``{"triage_level": ...}`` once that field
+        has closed in the stream, so the UI can react before the rest of
+        the JSON is generated; the last dict is always the complete,
+        validated assessment (same as assess_triage()).
+
+        Args:
+            chief_complaint: Patient's initial complaint in English.
+            answers: All question/answer pairs collected.
+
+        Yields:
+            A partial dict with triage_level, then the full assessment.
+        """
+        if not self._initialized:
+            yield self._mock_assessment(chief_complaint, answers)
+            return
+
+        messages = self._assessment_messages(chief_complaint, answers)
+        chunks: list[str] = []
+        level_sent: Optional[str] = None
+        try:
+            stream = self.openai_client.chat.completions.create(
+                model=self.deployment,
+                messages=messages,
+                response_format={"type": "json_object"},
+                max_completion_tokens=1000,
+                stream=True,
+            )
+            for event in stream:
+                # Azure sends content-filter results in choice-less events
+                if not event.choices or not event.choices[0].delta.content:
+                    continue
+                chunks.append(event.choices[0].delta.content)
+                if not level_sent:
+                    match = _TRIAGE_LEVEL_FIELD.search("".join(chunks))
+                    if match:
+                        level_sent = match.group(1)
+                        yield {"triage_level": level_sent}
+
+            assessment = _json_loads("".join(chunks))
+        except Exception as exc:
+            logger.error("Triage assessment stream error: %s", exc)
+            fallback = self._mock_assessment(chief_complaint, answers)
+            if level_sent:
+                # The UI already shows the streamed level; never contradict it
+                fallback["triage_level"] = level_sent
+            yield fallback
+            return
+
+        if assessment.get("triage_level") not in _TRIAGE_LEVELS:
+            assessment["triage_level"] = TRIAGE_URGENT
+        logger.info(
+            "Triage assessment (streamed): %s (risk=%s) for '%s'",
+            assessment.get("triage_level"),
+            assessment.get("risk_score"),
+            chief_complaint[:50],
+        )
+        yield assessment
+
+    async def aassess_triage(
+        self,
+        chief_complaint: str,
+        answers: list[dict],
+    ) -> dict:
+        """Async variant of assess_triage()."""
+        if not self._initialized or self._async_settings is None:
+            return self._mock_assessment(chief_complaint, answers)
 
-        # Build demographic context string
-        demo_context = ""
-        if demographics:
-            age   = demographics.get("age_range", "unknown")
-            sex   = demographics.get("sex", "unknown")
-            demo_context = f"\nPATIENT DEMOGRAPHICS: Age range: {age} | Biological sex: {sex}"
-            logger.info("Generating questions with demographics: age=%s sex=%s", age, sex)
+        rag = await self._aretrieve_context(chief_complaint)
+        messages = self._assessment_messages(chief_complaint, answers, rag=rag)
 
-        # Build previous answers context
-        answers_context = ""
-        if previous_answers:
-            answers_context = "\nPrevious patient answers:\n"
-            for ans in previous_answers:
-                answers_context += f"- Q: {ans.get('question', '')} → A: {ans.get('answer', '')}\n"
+        try:
+            response = await self._achat(messages, TriageAssessment)
+            return self._parse_assessment(response, chief_complaint)
 
-        # AI-102: Adapt system prompt based on RAG availability
-        if rag_found:
-            knowledge_section = f"""MEDICAL GUIDELINES (base your questions on these):
-{context}
+        except Exception as exc:
+            logger.error("Triage assessment error: %s", exc)
+            return self._mock_assessment(chief_complaint, answers)
 
-Base all questions on the guidelines above."""
-        else:
-            knowledge_section = """KNOWLEDGE SOURCE: General medical knowledge (no specific protocol found in knowledge base).
-Use evidence-based clinical assessment principles for this complaint."""
+    async def batch_assess_triage(self, cases: list[dict]) -> list[dict]:
+        """Assess many patients concurrently.
 
-        system_prompt = f"""You are an emergency medical triage AI assistant. Your role is to
-ask focused, condition-specific follow-up questions to assess the severity of a patient's condition.
+        AI-102: Completions are latency-bound, so overlapping them gives a
+        near-linear speedup; a semaphore keeps at most
+        _BATCH_CONCURRENCY requests in flight to respect the deployment's
+        rate limit.
 
-{knowledge_section}
+        Args:
+            cases: Dicts with 'chief_complaint' and 'answers' keys.
 
-RULES:
-1. Generate 3-5 focused follow-up questions SPECIFIC to this exact complaint.
-2. Use the patient demographics to adapt questions to their risk profile.
-   - Males 45+: prioritise cardiac red flags
-   - Females 18-44: consider gynaecological causes for abdominal pain
-   - Under 18: consider paediatric presentations and doses
-   - 75+: consider falls, polypharmacy, atypical presentations
-3. Questions must help determine triage level: EMERGENCY, URGENT, or ROUTINE.
-4. Prioritise RED FLAG assessment questions first.
-5. Keep questions simple — the patient may be in distress.
-6. Do NOT ask age or sex (already collected). Do NOT repeat previous answers.
-7. Questions must be SPECIFIC to the complaint — not generic.
+        Returns:
+            One assessment dict per case, in input order.
+        """
+        sem = asyncio.Semaphore(_BATCH_CONCURRENCY)
 
-CRITICAL OUTPUT RULES — MUST FOLLOW:
-- NEVER use type "free_text". The patient cannot type — they are in distress.
-- Every single question MUST have a non-empty "options" list with 2-6 clickable choices.
-- For time questions use options like: ["Just now", "Less than 1 hour", "1-6 hours", "6-24 hours", "More than 1 day"]
-- For onset questions use: ["Suddenly", "Gradually over minutes", "Gradually over hours", "Gradually over days"]
-- For location questions use specific anatomical options.
-- For severity always use scale type with options ["1","2","3","4","5","6","7","8","9","10"].
-- Allowed types: "yes_no", "scale", "multiple_choice" ONLY.
+        async def one(case: dict) -> dict:
+            async with sem:
+                return await self.aassess_triage(
+                    case.get("chief_complaint", ""), case.get("answers", [])
+                )
 
-OUTPUT FORMAT (strict JSON):
-{{
-  "questions": [
-    {{
-      "question": "Does the pain radiate to your arm, jaw, or back?",
-      "type": "yes_no",
-      "options": ["Yes", "No"],
-      "clinical_rationale": "Assessing for cardiac radiation pattern"
-    }},
-    {{
-      "question": "Rate your pain on a scale of 1-10",
-      "type": "scale",
-      "options": ["1", "2", "3", "4", "5", "6", "7", "8", "9", "10"],
-      "clinical_rationale": "Pain severity assessment"
-    }},
-    {{
-      "question": "When did the pain start?",
-      "type": "multiple_choice",
-      "options": ["Just now", "Less than 1 hour ago", "1-6 hours ago", "6-24 hours ago", "More than 1 day ago"],
-      "clinical_rationale": "Onset timing for urgency assessment"
-    }},
-    {{
-      "question": "Do you have any of these symptoms?",
-      "type": "multiple_choice",
-      "options": ["Sweating", "Shortness of breath", "Nausea", "Dizziness", "None"],
-      "clinical_rationale": "Checking for associated cardiac symptoms"
-    }}
-  ]
-}}
-"""
+        return list(await asyncio.gather(*map(one, cases)))
 
-        user_message = (
-            f"Chief complaint: {chief_complaint}"
-            f"{demo_context}"
-            f"{answers_context}"
-            f"\n\nGenerate condition-specific triage assessment questions."
-        )
+    def assess_triage_batch(self, cases: list[dict]) -> list[dict]:
+        """Assess several patients per completion for screening workloads.
+
+        Up to _CASES_PER_CALL cases are packed into one user message so the
+        system prompt is paid for once per group instead of once per
+        patient. The model answers from general clinical knowledge (no
+        per-case RAG), so use assess_triage() for interactive triage.
+        Cases missing from, or garbled in, the model's reply are assessed
+        individually.
+
+        Args:
+            cases: Dicts with 'chief_complaint' and 'answers' keys.
 
+        Returns:
+            One assessment dict per case, in input order.
+        """
         if not self._initialized:
-            return self._mock_questions(chief_complaint)
+            return [
+                self._mock_assessment(c.get("chief_complaint", ""), c.get("answers", []))
+                for c in cases
+            ]
+
+        results: list[dict] = []
+        for start in range(0, len(cases), _CASES_PER_CALL):
+            results.extend(self._assess_case_group(cases[start:start + _CASES_PER_CALL]))
+        return results
+
+    def _assess_case_group(self, group: list[dict]) -> list[dict]:
+        """Assess one group of cases in a single completion."""
+        user_message = "\n\n".join(
+            f"=== CASE {i} ===\n"
+            f"Chief complaint: {case.get('chief_complaint', '')}\n"
+            f"Patient answers:\n"
+            + "\n".join(
+                f"Q: {a.get('question', '')} → A: {a.get('answer', '')}"
+                for a in case.get("answers", [])
+            )
+            for i, case in enumerate(group)
+        ) + "\n\nProvide a triage assessment for every case."
 
+        by_index: dict[int, dict] = {}
         try:
             response = self.openai_client.chat.completions.create(
                 model=self.deployment,
                 messages=[
-                    {"role": "system", "content": system_prompt},
+                    {"role": "system", "content": _MULTI_CASE_PROMPT},
                     {"role": "user", "content": user_message},
                 ],
                 response_format={"type": "json_object"},
-                max_completion_tokens=1000,
+                max_completion_tokens=min(
+                    _TOKENS_PER_CASE * len(group), _MAX_BATCH_COMPLETION_TOKENS
+                ),
             )
+            for item in _json_loads(response.choices[0].message.content).get("assessments", []):
+                if isinstance(item, dict) and isinstance(item.get("case_index"), int):
+                    by_index[item.pop("case_index")] = item
 
-            result = json.loads(response.choices[0].message.content)
-            questions = result.get("questions", [])
-
-            # Grup B: Token usage tracking for cost monitoring (Instruction requirement)
             usage = getattr(response, "usage", None)
             if usage:
                 logger.info(
-                    "generate_questions — tokens used: prompt=%d completion=%d total=%d",
+                    "assess_triage_batch — %d cases, tokens used: prompt=%d completion=%d total=%d",
+                    len(group),
                     usage.prompt_tokens,
                     usage.completion_tokens,
                     usage.total_tokens,
                 )
+        except Exception as exc:
+            logger.error("Batched triage assessment error: %s", exc)
+
+        results = []
+        for i, case in enumerate(group):
+            assessment = by_index.get(i)
+            if assessment is None:
+                results.append(self.assess_triage(
+                    case.get("chief_complaint", ""), case.get("answers", [])
+                ))
+                continue
+            if assessment.get("triage_level") not in _TRIAGE_LEVELS:
+                assessment["triage_level"] = TRIAGE_URGENT
+            results.append(assessment)
+        return results
 
-            logger.info(
-                "Generated %d questions for: %s", len(questions), chief_complaint[:50]
-            )
-            return questions
+    def _chat(self, messages: list[dict], schema: type[BaseModel]):
+        """Issue a chat completion whose reply must match ``schema``.
 
-        except Exception as exc:
-            logger.error("Question generation error: %s", exc)
-            return self._mock_questions(chief_complaint)
+        AI-102: Structured outputs (json_schema response_format) make the
+        service enforce the schema, so replies no longer fail to parse
+        and drop to the mock path. Deployments or API versions without
+        structured-output support are detected once and served in JSON
+        mode from then on.
+        """
+        if self._structured_outputs:
+            try:
+                return self.openai_client.beta.chat.completions.parse(
+                    model=self.deployment,
+                    messages=messages,
+                    response_format=schema,
+                    max_completion_tokens=1000,
+                )
+            except Exception as exc:
+                if not _unsupported_schema(exc):
+                    raise
+                self._disable_structured_outputs(exc)
+        return self.openai_client.chat.completions.create(
+            model=self.deployment,
+            messages=messages,
+            response_format={"type": "json_object"},
+            max_completion_tokens=1000,
+        )
 
-    # ------------------------------------------------------------------
-    # Triage assessment
-    # ------------------------------------------------------------------
+    async def _achat(self, messages: list[dict], schema: type[BaseModel]):
+        """Async _chat() on the async client."""
+        if self._structured_outputs:
+            try:
+                return await self._async_openai().beta.chat.completions.parse(
+                    model=self.deployment,
+                    messages=messages,
+                    response_format=schema,
+                    max_completion_tokens=1000,
+                )
+            except Exception as exc:
+                if not _unsupported_schema(exc):
+                    raise
+                self._disable_structured_outputs(exc)
+        return await self._async_openai().chat.completions.create(
+            model=self.deployment,
+            messages=messages,
+            response_format={"type": "json_object"},
+            max_completion_tokens=1000,
+        )
 
-    def assess_triage(
+    def _disable_structured_outputs(self, exc: Exception) -> None:
+        """Fall back to JSON mode for this engine's remaining calls."""
+        self._structured_outputs = False
+        logger.warning(
+            "Structured outputs not supported by deployment '%s' (%s); using JSON mode.",
+            self.deployment, exc,
+        )
+
+    def _assessment_messages(
         self,
         chief_complaint: str,
         answers: list[dict],
-    ) -> dict:
-        """Perform final triage assessment based on all collected information.
-
-        AI-102 (RAG + Generative AI): Combines retrieved medical guidelines
-        with patient answers to produce a grounded triage classification.
-        The model must cite which guidelines informed its decision.
-
-        Args:
-            chief_complaint: Patient's initial complaint in English.
-            answers: All question/answer pairs collected.
+        rag: Optional[tuple[str, bool]] = None,
+    ) -> list[dict]:
+        """Build the chat messages for triage assessment.
 
-        Returns:
-            Assessment dict with triage_level, assessment, red_flags,
-            recommended_action, risk_score, and source_guidelines.
+        ``rag`` is a prefetched _retrieve_context() result; when omitted
+        the knowledge base is searched here.
         """
-        context, rag_found = self._retrieve_context(chief_complaint)
+        context, rag_found = rag or self._retrieve_context(chief_complaint)
 
         answers_text = "\n".join(
             f"Q: {a.get('question', '')} → A: {a.get('answer', '')}"
@@ -388,81 +1356,130 @@ You MUST cite the guideline sources used in source_guidelines."""
             knowledge_section = """KNOWLEDGE SOURCE: General medical knowledge (no specific protocol found in knowledge base).
 Use evidence-based clinical principles. Set source_guidelines to an empty list []."""
 
-        system_prompt = f"""You are an emergency medical triage AI. Analyze the patient's
-symptoms and answers to determine the appropriate triage level.
-
-{knowledge_section}
-
-ASSESSMENT RULES:
-1. Identify ALL red flags present.
-2. Classify into: EMERGENCY, URGENT, or ROUTINE.
-3. Provide a clear assessment summary.
-4. Recommend specific actions.
-
-OUTPUT FORMAT (strict JSON):
-{{
-  "triage_level": "EMERGENCY|URGENT|ROUTINE",
-  "assessment": "Brief clinical assessment summary",
-  "red_flags": ["list", "of", "identified", "red", "flags"],
-  "recommended_action": "What the patient should do",
-  "risk_score": 8,
-  "source_guidelines": ["guideline sources used, or empty list if none"],
-  "suspected_conditions": ["possible conditions"],
-  "time_sensitivity": "How urgent (e.g., 'Seek ER within 10 minutes')"
-}}
-"""
 
         user_message = (
             f"Chief complaint: {chief_complaint}\n\n"
             f"Patient answers:\n{answers_text}\n\n"
             f"Provide triage assessment."
         )
+        return [
+            {"role": "system", "content": _system_prompt(_ASSESSMENT_PROMPT, knowledge_section)},
+            {"role": "user", "content": user_message},
+        ]
 
-        if not self._initialized:
-            return self._mock_assessment(chief_complaint, answers)
+    def _parse_assessment(self, response, chief_complaint: str) -> dict:
+        """Extract and validate the assessment from a chat completion."""
+        parsed = getattr(response.choices[0].message, "parsed", None)
+        if parsed is not None:
+            assessment = parsed.model_dump()
+        else:
+            assessment = _json_loads(response.choices[0].message.content)
 
-        try:
-            response = self.openai_client.chat.completions.create(
-                model=self.deployment,
-                messages=[
-                    {"role": "system", "content": system_prompt},
-                    {"role": "user", "content": user_message},
-                ],
-                response_format={"type": "json_object"},
-                max_completion_tokens=1000,
+        # Grup B: Token usage tracking for cost monitoring (Instruction requirement)
+        usage = getattr(response, "usage", None)
+        if usage:
+            logger.info(
+                "assess_triage — tokens used: prompt=%d completion=%d total=%d",
+                usage.prompt_tokens,
+                usage.completion_tokens,
+                usage.total_tokens,
             )
 
-            assessment = json.loads(response.choices[0].message.content)
+        # Validate triage level
+        if assessment.get("triage_level") not in _TRIAGE_LEVELS:
+            assessment["triage_level"] = TRIAGE_URGENT
 
-            # Grup B: Token usage tracking for cost monitoring (Instruction requirement)
-            usage = getattr(response, "usage", None)
-            if usage:
-                logger.info(
-                    "assess_triage — tokens used: prompt=%d completion=%d total=%d",
-                    usage.prompt_tokens,
-                    usage.completion_tokens,
-                    usage.total_tokens,
-                )
+        logger.info(
+            "Triage assessment: %s (risk=%s) for '%s'",
+            assessment.get("triage_level"),
+            assessment.get("risk_score"),
+            chief_complaint[:50],
+        )
+        return assessment
 
-            # Validate triage level
-            if assessment.get("triage_level") not in (
-                TRIAGE_EMERGENCY,
-                TRIAGE_URGENT,
-                TRIAGE_ROUTINE,
-            ):
-                assessment["triage_level"] = TRIAGE_URGENT
+    # ------------------------------------------------------------------
+    # Offline assessment (Azure OpenAI Batch API)
+    # ------------------------------------------------------------------
 
-            logger.info(
-                "Triage assessment: %s (risk=%s) for '%s'",
-                assessment.get("triage_level"),
-                assessment.get("risk_score"),
-                chief_complaint[:50],
+    def submit_batch_assessment(self, cases: list[dict]) -> Optional[str]:
+        """Submit non-interactive assessments as one Batch API job.
+
+        AI-102: The Batch API runs chat completions asynchronously within
+        a 24h window at roughly half the token price and outside the
+        deployment's realtime TPM quota. Use it for retrospective analysis
+        and eval runs; interactive triage stays on assess_triage().
+
+        Args:
+            cases: Dicts with 'chief_complaint', 'answers' and an optional
+                'case_id' (defaults to the case's index).
+
+        Returns:
+            The batch job ID, or None if Azure OpenAI is not configured.
+        """
+        if not self._initialized:
+            logger.warning("Batch assessment needs Azure OpenAI; nothing submitted.")
+            return None
+
+        deployment = os.getenv("GPT_BATCH_DEPLOYMENT", self.deployment)
+        lines: list[bytes] = []
+        for i, case in enumerate(cases):
+            messages = self._assessment_messages(
+                case.get("chief_complaint", ""), case.get("answers", [])
             )
-            return assessment
+            lines.append(_json_dumps({
+                "custom_id": str(case.get("case_id", i)),
+                "method": "POST",
+                "url": "/chat/completions",
+                "body": {
+                    "model": deployment,
+                    "messages": messages,
+                    "response_format": {"type": "json_object"},
+                    "max_completion_tokens": 1000,
+                },
+            }))
+        payload = b"\n".join(lines) + b"\n"
 
-        except Exception as exc:
-            logger.error("Triage assessment error: %s", exc)
-            return self._mock_assessment(chief_complaint, answers)
+        batch_file = self.openai_client.files.create(
+            file=("triage_batch.jsonl", payload), purpose="batch"
+        )
+        batch = self.openai_client.batches.create(
+            input_file_id=batch_file.id,
+            endpoint="/chat/completions",
+            completion_window="24h",
+        )
+        logger.info("Submitted batch %s with %d case(s).", batch.id, len(cases))
+        return batch.id
+
+    def poll_batch(self, batch_id: str) -> str:
+        """Return the status of a batch job (e.g. 'in_progress', 'completed')."""
+        return self.openai_client.batches.retrieve(batch_id).status
+
+    def collect_batch_results(self, batch_id: str) -> Iterator[tuple[str, Optional[dict]]]:
+        """Yield (custom_id, assessment) pairs from a finished batch job.
+
+        Rows that failed on the service side yield None as the assessment.
+        Nothing is yielded while the job has no output file yet.
+        """
+        batch = self.openai_client.batches.retrieve(batch_id)
+        if not batch.output_file_id:
+            logger.info("Batch %s has no output yet (status=%s).", batch_id, batch.status)
+            return
+
+        output = self.openai_client.files.content(batch.output_file_id).text
+        for line in output.splitlines():
+            if not line.strip():
+                continue
+            row = _json_loads(line)
+            response = row.get("response") or {}
+            if row.get("error") or response.get("status_code") != 200:
+                logger.warning("Batch row %s failed: %s", row.get("custom_id"), row.get("error"))
+                yield row.get("custom_id"), None
+                continue
+            content = response["body"]["choices"][0]["message"]["content"]
+            assessment = _json_loads(content)
+            if assessment.get("triage_level") not in _TRIAGE_LEVELS:
+                assessment["triage_level"] = TRIAGE_URGENT
+            yield row.get("custom_id"), assessment
 
     # ------------------------------------------------------------------
     # Patient record creation
@@ -565,7 +1582,7 @@ OUTPUT FORMAT (strict JSON, no extra text):
                         "generate_pre_arrival_advice — tokens: prompt=%d completion=%d total=%d",
                         usage.prompt_tokens, usage.completion_tokens, usage.total_tokens,
                     )
-                advice = json.loads(response.choices[0].message.content)
+                advice = _json_loads(response.choices[0].message.content)
             except Exception as exc:
                 logger.error("Pre-arrival advice generation failed: %s", exc)
                 advice = self._mock_pre_arrival_advice(chief_complaint, triage_level)
@@ -576,10 +1593,10 @@ OUTPUT FORMAT (strict JSON, no extra text):
         # ── Step 4: Translate into patient's language ─────────────────────
         if self.translator and not language.startswith("en"):
             try:
-                translated_do   = [self.translator.translate_from_english(item, language) for item in do_list]
-                translated_dont = [self.translator.translate_from_english(item, language) for item in dont_list]
-                do_list   = translated_do
-                dont_list = translated_dont
+                # One request for both lists; split back by position
+                translated = self.translator.translate_many_from_english(do_list + dont_list, language)
+                do_list   = translated[:len(do_list)]
+                dont_list = translated[len(do_list):]
                 logger.info("Pre-arrival advice translated to %s.", language)
             except Exception as exc:
                 logger.warning("Advice translation failed (%s) — returning English.", exc)
@@ -820,7 +1837,7 @@ OUTPUT FORMAT (strict JSON):
                     "generate_hospital_prep — tokens: prompt=%d completion=%d total=%d",
                     usage.prompt_tokens, usage.completion_tokens, usage.total_tokens,
                 )
-            result = json.loads(response.choices[0].message.content)
+            result = _json_loads(response.choices[0].message.content)
             items = result.get("prep_items", [])
             logger.info("Generated %d hospital prep items for '%s'", len(items), chief_complaint[:50])
             return items
@@ -912,7 +1929,7 @@ OUTPUT FORMAT (strict JSON):
             Complete patient notification record.
         """
         now = datetime.now(timezone.utc)
-        patient_id = f"ER-{now.strftime('%Y')}-{uuid4().hex[:4].upper()}"
+        patient_id = f"ER-{now.year}-{secrets.token_hex(2).upper()}"
 
         record = {
             "patient_id": patient_id,
@@ -936,8 +1953,6 @@ OUTPUT FORMAT (strict JSON):
         }
 
         if eta_minutes is not None:
-            from datetime import timedelta
-
             arrival = now + timedelta(minutes=eta_minutes)
             record["arrival_time"] = arrival.isoformat()
 
@@ -950,169 +1965,13 @@ OUTPUT FORMAT (strict JSON):
 
     def _mock_questions(self, chief_complaint: str) -> list[dict]:
         """Generate mock questions when Azure OpenAI is unavailable."""
-        complaint_lower = chief_complaint.lower()
-
-        if any(kw in complaint_lower for kw in ["chest", "heart", "cardiac"]):
-            return [
-                {
-                    "question": "Does the pain radiate to your arm, jaw, or back?",
-                    "type": "yes_no",
-                    "options": ["Yes", "No"],
-                    "clinical_rationale": "Cardiac radiation pattern",
-                },
-                {
-                    "question": "Rate your pain on a scale of 1-10",
-                    "type": "scale",
-                    "options": [str(i) for i in range(1, 11)],
-                    "clinical_rationale": "Pain severity",
-                },
-                {
-                    "question": "Do you have any of these symptoms?",
-                    "type": "multiple_choice",
-                    "options": ["Sweating", "Shortness of breath", "Nausea", "Dizziness", "None"],
-                    "clinical_rationale": "Associated symptoms",
-                },
-                {
-                    "question": "Do you have a history of heart disease?",
-                    "type": "yes_no",
-                    "options": ["Yes", "No"],
-                    "clinical_rationale": "Cardiac history",
-                },
-            ]
-
-        if any(kw in complaint_lower for kw in ["head", "stroke", "face", "speech"]):
-            return [
-                {
-                    "question": "Did symptoms start suddenly?",
-                    "type": "yes_no",
-                    "options": ["Yes", "No"],
-                    "clinical_rationale": "Sudden onset assessment",
-                },
-                {
-                    "question": "Can you smile with both sides of your face?",
-                    "type": "yes_no",
-                    "options": ["Yes", "No"],
-                    "clinical_rationale": "FAST - Face assessment",
-                },
-                {
-                    "question": "Can you raise both arms equally?",
-                    "type": "yes_no",
-                    "options": ["Yes", "No"],
-                    "clinical_rationale": "FAST - Arms assessment",
-                },
-                {
-                    "question": "Is your speech slurred or unclear?",
-                    "type": "yes_no",
-                    "options": ["Yes", "No"],
-                    "clinical_rationale": "FAST - Speech assessment",
-                },
-            ]
-
-        if any(kw in complaint_lower for kw in ["stomach", "abdom", "belly", "vomit", "nausea"]):
-            return [
-                {
-                    "question": "Where exactly is the pain?",
-                    "type": "multiple_choice",
-                    "options": ["Upper right", "Upper left", "Lower right", "Lower left", "Central", "All over"],
-                    "clinical_rationale": "Pain localization for differential diagnosis",
-                },
-                {
-                    "question": "Rate your pain on a scale of 1-10",
-                    "type": "scale",
-                    "options": [str(i) for i in range(1, 11)],
-                    "clinical_rationale": "Pain severity assessment",
-                },
-                {
-                    "question": "Do you have any of these symptoms?",
-                    "type": "multiple_choice",
-                    "options": ["Fever", "Vomiting", "Diarrhea", "Blood in stool", "None"],
-                    "clinical_rationale": "Associated GI symptoms",
-                },
-                {
-                    "question": "Was the onset sudden or gradual?",
-                    "type": "yes_no",
-                    "options": ["Sudden", "Gradual"],
-                    "clinical_rationale": "Onset pattern for surgical vs medical cause",
-                },
-            ]
-
-        if any(kw in complaint_lower for kw in ["breath", "asthma", "wheez", "cough", "lung"]):
-            return [
-                {
-                    "question": "Can you complete a full sentence without stopping to breathe?",
-                    "type": "yes_no",
-                    "options": ["Yes", "No"],
-                    "clinical_rationale": "Severity of respiratory distress",
-                },
-                {
-                    "question": "When did the breathing difficulty start?",
-                    "type": "multiple_choice",
-                    "options": ["Just now", "Hours ago", "Days ago", "Ongoing"],
-                    "clinical_rationale": "Onset timing",
-                },
-                {
-                    "question": "Do you have asthma, COPD, or any lung disease?",
-                    "type": "yes_no",
-                    "options": ["Yes", "No"],
-                    "clinical_rationale": "Respiratory history",
-                },
-                {
-                    "question": "Were you exposed to anything before this started?",
-                    "type": "multiple_choice",
-                    "options": ["Allergen", "Smoke/fumes", "Cold air", "Exercise", "Nothing specific"],
-                    "clinical_rationale": "Trigger identification",
-                },
-            ]
-
-        if any(kw in complaint_lower for kw in ["diabet", "sugar", "insulin", "glucose"]):
-            return [
-                {
-                    "question": "Do you have diabetes? What type?",
-                    "type": "multiple_choice",
-                    "options": ["Type 1", "Type 2", "Not sure", "No diabetes"],
-                    "clinical_rationale": "Diabetes classification",
-                },
-                {
-                    "question": "What is your blood sugar if known?",
-                    "type": "multiple_choice",
-                    "options": ["Below 70 mg/dL", "70-180 mg/dL", "180-300 mg/dL", "Above 300 mg/dL", "Don't know"],
-                    "clinical_rationale": "Glucose level assessment",
-                },
-                {
-                    "question": "Do you have nausea, vomiting, or abdominal pain?",
-                    "type": "yes_no",
-                    "options": ["Yes", "No"],
-                    "clinical_rationale": "DKA symptom check",
-                },
-                {
-                    "question": "Are you feeling confused or drowsy?",
-                    "type": "yes_no",
-                    "options": ["Yes", "No"],
-                    "clinical_rationale": "Altered mental status assessment",
-                },
-            ]
-
-        # Generic questions
-        return [
-            {
-                "question": "When did the symptoms start?",
-                "type": "multiple_choice",
-                "options": ["Just now", "Hours ago", "Days ago", "Weeks ago"],
-                "clinical_rationale": "Onset timing",
-            },
-            {
-                "question": "Rate your discomfort on a scale of 1-10",
-                "type": "scale",
-                "options": [str(i) for i in range(1, 11)],
-                "clinical_rationale": "Severity assessment",
-            },
-            {
-                "question": "Do you have any chronic medical conditions?",
-                "type": "yes_no",
-                "options": ["Yes", "No"],
-                "clinical_rationale": "Medical history",
-            },
-        ]
+        topics = _COMPLAINT_TOPICS.tags(chief_complaint.lower())
+        questions = next(
+            (qs for topic, qs in _MOCK_QUESTION_ROUTES if topic in topics),
+            _GENERIC_QUESTIONS,
+        )
+        # Callers annotate and translate questions in place
+        return [{**q, "options": list(q["options"])} for q in questions]
 
     def _mock_assessment(self, chief_complaint: str, answers: list[dict]) -> dict:
         """Generate mock assessment when Azure OpenAI is unavailable.
@@ -1131,35 +1990,17 @@ OUTPUT FORMAT (strict JSON):
         complaint_lower = chief_complaint.lower()
 
         # ── Detect clinical context from chief complaint (set ONCE) ──────
-        is_cardiac = any(kw in complaint_lower for kw in [
-            "chest", "heart", "cardiac", "palpitat",
-        ])
-        is_stroke = any(kw in complaint_lower for kw in [
-            "stroke", "slurred", "speech", "face droop", "arm weakness",
-            "can't move", "sudden weakness", "facial",
-        ])
-        is_respiratory = any(kw in complaint_lower for kw in [
-            "breath", "asthma", "wheez", "cough", "lung", "inhaler",
-        ])
-        is_abdominal = any(kw in complaint_lower for kw in [
-            "stomach", "abdom", "belly", "vomit", "nausea", "appendix",
-        ])
-        is_diabetic = any(kw in complaint_lower for kw in [
-            "diabet", "sugar", "insulin", "glucose", "hypoglycemi",
-        ])
-
-        # ── Multilingual affirmative / negative sets ──────────────────────
-        # EN / DE / TR / FR / ES / IT / PT / RU / AR / ZH
-        AFFIRMATIVE = {
-            "yes", "ja", "evet", "oui", "sí", "si", "sì", "sim", "да", "نعم", "是",
-        }
-        NEGATIVE = {
-            "no", "nein", "hayır", "non", "não", "нет", "لا", "否",
-        }
+        complaint_tags = _COMPLAINT_KEYWORDS.tags(complaint_lower)
+        is_cardiac = "cardiac" in complaint_tags
+        is_stroke = "stroke" in complaint_tags
+        is_respiratory = "respiratory" in complaint_tags
+        is_abdominal = "abdominal" in complaint_tags
+        is_diabetic = "diabetic" in complaint_tags
 
         # ── Accumulators ─────────────────────────────────────────────────
-        red_flags: list[str] = []
-        positive_findings: list[str] = []
+        # Dicts act as insertion-ordered sets, so repeats collapse on entry
+        red_flags: dict[str, None] = {}
+        positive_findings: dict[str, None] = {}
         negative_findings: list[str] = []
         severity_score = 0
 
@@ -1172,143 +2013,126 @@ OUTPUT FORMAT (strict JSON):
                 val = int(answer)
                 if val >= 7:
                     severity_score += 3
-                    positive_findings.append(f"Pain severity {val}/10")
+                    positive_findings[f"Pain severity {val}/10"] = None
                 elif val >= 4:
                     severity_score += 1
 
             # ── 2. Yes/No answers — matched ONLY to their own question ───
-            is_affirmative = answer in AFFIRMATIVE
-            is_negative    = answer in NEGATIVE
+            is_affirmative = answer in _AFFIRMATIVE
+            is_negative    = answer in _NEGATIVE
+
+            # One scan of the question finds every keyword group it hits
+            q_tags = _QUESTION_KEYWORDS.tags(question) if is_affirmative or is_negative else ()
 
             if is_affirmative:
                 severity_score += 1
 
                 # CARDIAC: radiation only when the question explicitly asks
                 # about radiation/jaw/back — NOT when it mentions "arm raise"
-                if is_cardiac and any(w in question for w in ["radiat", "jaw", "back"]):
-                    red_flags.append("pain_radiation")
-                    positive_findings.append("Pain radiates to arm/jaw/back")
+                if is_cardiac and "radiation" in q_tags:
+                    red_flags["pain_radiation"] = None
+                    positive_findings["Pain radiates to arm/jaw/back"] = None
 
                 # CARDIAC: history
-                if any(w in question for w in ["heart disease", "cardiac history", "prior heart"]):
-                    red_flags.append("cardiac_history")
-                    positive_findings.append("History of heart disease")
+                if "cardiac_history" in q_tags or "prior_heart" in q_tags:
+                    red_flags["cardiac_history"] = None
+                    positive_findings["History of heart disease"] = None
 
                 # STROKE / FAST — sudden onset (affirmative = bad)
-                if any(w in question for w in ["sudden", "suddenly", "plötzlich", "aniden"]):
-                    red_flags.append("sudden_onset")
-                    positive_findings.append("Sudden onset of symptoms")
+                if "sudden" in q_tags:
+                    red_flags["sudden_onset"] = None
+                    positive_findings["Sudden onset of symptoms"] = None
 
                 # STROKE / FAST — speech slurred (affirmative = bad)
-                if any(w in question for w in ["slur", "slurred", "unclear speech"]):
-                    red_flags.append("speech_impairment")
-                    positive_findings.append("Speech is slurred")
+                if "speech" in q_tags:
+                    red_flags["speech_impairment"] = None
+                    positive_findings["Speech is slurred"] = None
 
                 # STROKE / FAST — face symmetry (affirmative = GOOD, no red flag)
-                if any(w in question for w in ["smile", "face", "symmetr", "both sides"]):
-                    positive_findings.append("Facial symmetry intact")
+                if "face" in q_tags:
+                    positive_findings["Facial symmetry intact"] = None
 
                 # STROKE / FAST — arm raise (affirmative = GOOD, no red flag)
                 # FIX: "arm" alone no longer triggers cardiac pain_radiation
-                if any(w in question for w in ["raise", "lift both", "arms equally"]):
-                    positive_findings.append("Can raise both arms equally")
+                if "arm_raise" in q_tags:
+                    positive_findings["Can raise both arms equally"] = None
 
                 # GENERAL
-                if any(w in question for w in ["fever", "fieber", "ateş", "temperature"]):
-                    red_flags.append("fever")
-                    positive_findings.append("Has fever")
-                if any(w in question for w in ["blood", "blut", "bleeding", "bleed"]):
-                    red_flags.append("bleeding")
-                    positive_findings.append("Blood present")
-                if any(w in question for w in ["chronic", "condition", "medical condition"]):
-                    positive_findings.append("Has chronic medical conditions")
-                if any(w in question for w in ["confused", "drowsy", "unconscious", "altered"]):
-                    red_flags.append("altered_mental_status")
-                    positive_findings.append("Confusion or drowsiness reported")
+                if "fever" in q_tags:
+                    red_flags["fever"] = None
+                    positive_findings["Has fever"] = None
+                if "blood" in q_tags:
+                    red_flags["bleeding"] = None
+                    positive_findings["Blood present"] = None
+                if "chronic" in q_tags:
+                    positive_findings["Has chronic medical conditions"] = None
+                if "mental_status" in q_tags:
+                    red_flags["altered_mental_status"] = None
+                    positive_findings["Confusion or drowsiness reported"] = None
 
             elif is_negative:
                 # STROKE / FAST — face symmetry (negative = RED FLAG)
-                if any(w in question for w in ["smile", "face", "symmetr", "both sides"]):
-                    red_flags.append("facial_asymmetry")
-                    positive_findings.append("Cannot smile symmetrically (facial droop)")
+                if "face" in q_tags:
+                    red_flags["facial_asymmetry"] = None
+                    positive_findings["Cannot smile symmetrically (facial droop)"] = None
 
                 # STROKE / FAST — arm raise (negative = RED FLAG)
-                if any(w in question for w in ["raise", "lift both", "arms equally"]):
-                    red_flags.append("arm_weakness")
-                    positive_findings.append("Cannot raise both arms equally")
+                if "arm_raise" in q_tags:
+                    red_flags["arm_weakness"] = None
+                    positive_findings["Cannot raise both arms equally"] = None
 
                 # STROKE / FAST — speech slurred (negative = GOOD)
-                if any(w in question for w in ["slur", "slurred", "unclear speech"]):
+                if "speech" in q_tags:
                     negative_findings.append("Speech is NOT slurred")
 
                 # RESPIRATORY
-                if any(w in question for w in ["sentence", "complete a", "breathe without"]):
-                    red_flags.append("severe_dyspnea")
-                    positive_findings.append("Cannot complete a sentence (severe dyspnea)")
+                if "sentence" in q_tags:
+                    red_flags["severe_dyspnea"] = None
+                    positive_findings["Cannot complete a sentence (severe dyspnea)"] = None
 
                 # CARDIAC history negative
-                if any(w in question for w in ["heart disease", "cardiac history"]):
+                if "cardiac_history" in q_tags:
                     negative_findings.append("No history of heart disease")
-                if any(w in question for w in ["chronic", "condition"]):
+                if "chronic" in q_tags:
                     negative_findings.append("No chronic conditions reported")
 
             # ── 3. Multi-choice symptom keywords (language-aware) ────────
-            if any(w in answer for w in [
-                "sweating", "schwitzen", "terleme", "transpiration",
-                "sudoración", "sudorazione", "suor", "потоотделение", "تعرق",
-            ]):
-                red_flags.append("diaphoresis")
-                positive_findings.append("Sweating")
-
-            if any(w in answer for w in [
-                "shortness", "breath", "atemnot", "nefes", "essoufflement",
-                "dificultad respirar", "mancanza di fiato", "falta de ar",
-                "одышка", "ضيق التنفس",
-            ]):
-                red_flags.append("dyspnea")
-                positive_findings.append("Shortness of breath")
-
-            if any(w in answer for w in [
-                "nausea", "übelkeit", "bulantı", "nausée", "náuseas",
-                "náusea", "тошнота", "غثيان",
-            ]):
-                positive_findings.append("Nausea")
-
-            if any(w in answer for w in [
-                "dizz", "schwindel", "baş dönmesi", "vertige", "mareo",
-                "vertigine", "tontura", "головокружение", "دوار",
-            ]):
-                red_flags.append("dizziness")
-                positive_findings.append("Dizziness")
-
-            if any(w in answer for w in [
-                "vomit", "erbrechen", "kusma", "vomissement", "vómito",
-                "vomito", "vômito", "рвота", "قيء",
-            ]):
-                positive_findings.append("Vomiting")
-
-            if any(w in answer for w in [
-                "fever", "fieber", "ateş", "fièvre", "fiebre", "febbre",
-                "febre", "лихорадка", "حمى",
-            ]):
-                red_flags.append("fever")
-                positive_findings.append("Fever")
-
-            if any(w in answer for w in [
-                "blood", "blut", "kan", "sang", "sangre", "sangue",
-                "кровь", "دم",
-            ]):
-                red_flags.append("bleeding_sign")
-                positive_findings.append("Blood reported")
-
-            if "lower right" in answer:
-                positive_findings.append("Lower right quadrant pain (possible appendicitis)")
-            if "all over" in answer or "diffuse" in answer:
-                red_flags.append("diffuse_pain")
-                positive_findings.append("Diffuse abdominal pain")
-
-        # ── Deduplicate while preserving order ────────────────────────────
-        red_flags = list(dict.fromkeys(red_flags))
+            a_tags = _ANSWER_KEYWORDS.tags(answer)
+
+            if "sweating" in a_tags:
+                red_flags["diaphoresis"] = None
+                positive_findings["Sweating"] = None
+
+            if "dyspnea" in a_tags:
+                red_flags["dyspnea"] = None
+                positive_findings["Shortness of breath"] = None
+
+            if "nausea" in a_tags:
+                positive_findings["Nausea"] = None
+
+            if "dizziness" in a_tags:
+                red_flags["dizziness"] = None
+                positive_findings["Dizziness"] = None
+
+            if "vomiting" in a_tags:
+                positive_findings["Vomiting"] = None
+
+            if "fever" in a_tags:
+                red_flags["fever"] = None
+                positive_findings["Fever"] = None
+
+            if "blood" in a_tags:
+                red_flags["bleeding_sign"] = None
+                positive_findings["Blood reported"] = None
+
+            if "lower_right" in a_tags:
+                positive_findings["Lower right quadrant pain (possible appendicitis)"] = None
+            if "diffuse" in a_tags:
+                red_flags["diffuse_pain"] = None
+                positive_findings["Diffuse abdominal pain"] = None
+
+        red_flags = list(red_flags)
+        positive_findings = list(positive_findings)
 
         # ── FAST stroke logic: facial_asymmetry OR arm_weakness = EMERGENCY ─
         fast_positive = "facial_asymmetry" in red_flags or "arm_weakness" in red_flags
@@ -1316,28 +2140,18 @@ OUTPUT FORMAT (strict JSON):
         stroke_emergency = is_stroke and ("sudden_onset" in red_flags or fast_positive)
 
         # ── Triage level ──────────────────────────────────────────────────
-        emergency_complaint_kw = [
-            "chest pain", "heart attack", "stroke", "unconscious",
-            "can't breathe", "seizure", "arm weakness", "face droop",
-            "can't move", "slurred",
-        ]
-        urgent_complaint_kw = [
-            "pain", "fever", "vomiting", "broken", "injury",
-            "fall", "cough", "stomach",
-        ]
-
         if (
             fast_positive
             or stroke_emergency
             or len(red_flags) >= 3
-            or any(kw in complaint_lower for kw in emergency_complaint_kw)
+            or "emergency" in complaint_tags
         ):
             level = TRIAGE_EMERGENCY
             risk_score = min(10, 7 + len(red_flags))
         elif (
             len(red_flags) >= 1
             or severity_score >= 3
-            or any(kw in complaint_lower for kw in urgent_complaint_kw)
+            or "urgent" in complaint_tags
         ):
             level = TRIAGE_URGENT
             risk_score = min(8, 4 + len(red_flags))
@@ -11,6 +11,7 @@ Or:       python tests/test_scenarios.py
 
 from __future__ import annotations
 
+import asyncio
 import json
 import sys
 import unittest
@@ -109,6 +110,78 @@ class TestTriageEngine(unittest.TestCase):
         # Should be EMERGENCY due to FAST positive
         self.assertIn(assessment["triage_level"], [TRIAGE_EMERGENCY, TRIAGE_URGENT])
 
+    def test_batch_assessment_keeps_case_order(self):
+        """Batch assessment should return one result per case, in order."""
+        cases = [
+            {"chief_complaint": "severe chest pain", "answers": []},
+            {"chief_complaint": "mild headache", "answers": []},
+        ]
+        results = asyncio.run(self.engine.batch_assess_triage(cases))
+        self.assertEqual(len(results), 2)
+        self.assertEqual(results[0]["triage_level"], TRIAGE_EMERGENCY)
+        self.assertEqual(results[1]["triage_level"], TRIAGE_ROUTINE)
+
+    def test_streamed_assessment_ends_with_full_result(self):
+        """The last streamed dict should be the complete assessment."""
+        answers = [{"question": "Pain severity 1-10?", "answer": "9"}]
+        streamed = list(self.engine.assess_triage_stream("severe chest pain", answers))
+        self.assertGreater(len(streamed), 0)
+        self.assertEqual(streamed[-1], self.engine.assess_triage("severe chest pain", answers))
+
+    def _streaming_engine(self, deltas, fail_after=False):
+        """Engine whose completion stream yields ``deltas`` (then optionally raises)."""
+        from types import SimpleNamespace
+
+        def create(**kwargs):
+            for delta in deltas:
+                yield SimpleNamespace(choices=[SimpleNamespace(delta=SimpleNamespace(content=delta))])
+            if fail_after:
+                raise ConnectionError("stream dropped")
+
+        engine = TriageEngine()
+        engine._initialized = True
+        engine.openai_client = SimpleNamespace(
+            chat=SimpleNamespace(completions=SimpleNamespace(create=create))
+        )
+        return engine
+
+    def test_streamed_level_is_yielded_before_full_result(self):
+        """The level should be yielded as soon as its field closes in the stream."""
+        engine = self._streaming_engine([
+            '{"triage_level": "EMER', 'GENCY", "risk_score": 9,',
+            ' "recommended_action": "Call 112"}',
+        ])
+        streamed = list(engine.assess_triage_stream("severe chest pain", []))
+        self.assertEqual(streamed[0], {"triage_level": TRIAGE_EMERGENCY})
+        self.assertEqual(streamed[-1]["triage_level"], TRIAGE_EMERGENCY)
+        self.assertEqual(streamed[-1]["risk_score"], 9)
+
+    def test_stream_failure_keeps_streamed_level(self):
+        """A failure after the level was yielded must not change that level."""
+        engine = self._streaming_engine(['{"triage_level": "EMERGENCY", "risk'], fail_after=True)
+        streamed = list(engine.assess_triage_stream("mild headache", []))
+        self.assertEqual(streamed[0], {"triage_level": TRIAGE_EMERGENCY})
+        self.assertEqual(streamed[-1]["triage_level"], TRIAGE_EMERGENCY)
+        self.assertIn("recommended_action", streamed[-1])
+
+    def test_context_retrieval_is_cached(self):
+        """The same complaint should hit the knowledge base only once."""
+        calls = []
+
+        class CountingIndexer:
+            def search(self, query, top=3):
+                calls.append(query)
+                return [{"source": "chest_pain_protocol.txt", "content": "ECG"}]
+
+        engine = TriageEngine(knowledge_indexer=CountingIndexer())
+        first = engine._retrieve_context("Chest pain")
+        second = engine._retrieve_context("  chest   PAIN ")
+        self.assertEqual(first, second)
+        self.assertEqual(len(calls), 1)
+        engine.cache_clear()
+        engine._retrieve_context("chest pain")
+        self.assertEqual(len(calls), 2)
+
     def test_patient_record_creation(self):
         """Patient record should contain all required fields."""
         assessment = {
@@ -215,6 +288,79 @@ class TestMapsHandler(unittest.TestCase):
         # They should be different sets of hospitals
         self.assertNotEqual(istanbul_names, stuttgart_names)
 
+    def test_country_inferred_from_location(self):
+        """Without an explicit country, the patient's position selects it."""
+        istanbul_hospitals = self.maps.find_nearest_hospitals(41.01, 28.98, count=3)
+        london_hospitals = self.maps.find_nearest_hospitals(51.50, -0.12, count=3)
+        self.assertEqual(len(istanbul_hospitals), 3)
+        self.assertTrue(all(h["country"] == "TR" for h in istanbul_hospitals))
+        self.assertTrue(all(h["country"] == "UK" for h in london_hospitals))
+
+    def test_rank_nearest_batch(self):
+        """Bulk ranking should agree with the single-patient search."""
+        from src.maps_handler import get_hospitals_by_country, rank_nearest_batch
+
+        origins = [(48.78, 9.18), (52.52, 13.40)]
+        idx, dist = rank_nearest_batch(origins, k=3, country="DE")
+        self.assertEqual(idx.shape, (2, 3))
+        hospitals = get_hospitals_by_country("DE")
+        for (lat, lon), row, row_dist in zip(origins, idx, dist):
+            nearest = self.maps._search_hospitals(lat, lon, 50, "DE")[0]
+            self.assertEqual(hospitals[row[0]]["name"], nearest["name"])
+            self.assertEqual(list(row_dist), sorted(row_dist))
+
+    def test_hospital_lookup_by_name(self):
+        """Hospitals should be found by exact name across all countries."""
+        from src.maps_handler import get_hospital_by_name
+
+        h = get_hospital_by_name("Marienhospital Stuttgart")
+        self.assertIsNotNone(h)
+        self.assertEqual(h["country"], "DE")
+        self.assertIsNone(get_hospital_by_name("No Such Hospital"))
+
+    def test_reported_occupancy_used_for_ranking(self):
+        """A reported occupancy level should replace the simulated one."""
+        from src import maps_handler
+
+        nearest = self.maps._search_hospitals(48.78, 9.18, 50, "DE")[0]
+        maps_handler.set_hospital_occupancy(nearest["name"], "full")
+        try:
+            self.assertEqual(maps_handler.get_hospital_occupancy(nearest["name"]), "full")
+            hospitals = self.maps.find_nearest_hospitals(48.78, 9.18, count=10)
+            match = next(h for h in hospitals if h["name"] == nearest["name"])
+            self.assertEqual(match["occupancy"], "full")
+        finally:
+            maps_handler._OCCUPANCY_REGISTRY = {}
+
+    def test_fallback_eta_batch_matches_scalar(self):
+        """Vectorized fallback ETAs should equal the per-hospital estimate."""
+        hospitals = self.maps._search_hospitals(48.78, 9.18, 50, "DE")
+        batch = self.maps._fallback_eta_batch(48.78, 9.18, hospitals)
+        single = [self.maps._fallback_eta(48.78, 9.18, h["lat"], h["lon"]) for h in hospitals]
+        self.assertEqual(batch, single)
+
+    def test_search_falls_back_to_nearest_outside_radius(self):
+        """With nothing in the radius, the nearest hospitals are still offered."""
+        results = self.maps._search_hospitals(53.07, 7.20, 5, "DE")
+        self.assertTrue(results)
+        self.assertGreater(results[0]["distance_km"], 5)
+
+    def test_eta_batch_one_per_hospital(self):
+        """Batch ETAs should come back in hospital order, one each."""
+        hospitals = self.maps._search_hospitals(48.78, 9.18, 50, "DE")
+        etas = self.maps.eta_batch(48.78, 9.18, hospitals)
+        self.assertEqual(len(etas), len(hospitals))
+        for h, eta in zip(hospitals, etas):
+            self.assertEqual(eta["distance_km"], h["distance_km"])
+
+    def test_iter_nearby_streams_nearest_first(self):
+        """Streamed hospitals should arrive nearest-first within the radius."""
+        streamed = list(self.maps.iter_nearby(52.52, 13.40, 50, "DE"))
+        self.assertGreater(len(streamed), 10)
+        dists = [h["distance_km"] for h in streamed]
+        self.assertEqual(dists, sorted(dists))
+        self.assertTrue(all(d <= 50 for d in dists))
+
     def test_haversine_distance(self):
         """Haversine distance calculation should be accurate."""
         # Stuttgart to Munich is approximately 190 km
@@ -364,6 +510,100 @@ class TestTranslator(unittest.TestCase):
         result = self.translator.translate("", "de")
         self.assertEqual(result, "")
 
+    def test_batch_keeps_order_and_blanks(self):
+        """Batch translation should return one entry per input, in order."""
+        texts = ["Hello", "", "Chest pain", "   "]
+        result = self.translator.translate_batch(texts, "de", source_language="de")
+        self.assertEqual(result, texts)
+
+    def test_local_language_only_when_unambiguous(self):
+        """Local detection should recognise clear English and defer otherwise."""
+        from src.translator import _local_language
+        self.assertEqual(_local_language("I have a headache since yesterday"), "en")
+        self.assertEqual(_local_language("У меня болит голова"), "ru")
+        self.assertIsNone(_local_language("Ich habe Kopfschmerzen"))
+        self.assertIsNone(_local_language("headache"))
+
+    def test_measurements_need_no_translation(self):
+        """Vitals, doses and ICD codes should bypass the service; words should not."""
+        from src.translator import _untranslatable
+        for text in ("38.5", "120/80 mmHg", "5 mg", "R07.4"):
+            self.assertTrue(_untranslatable(text), text)
+        for text in ("No", "Chest pain", "ibuprofen"):
+            self.assertFalse(_untranslatable(text), text)
+
+
+class TestSafetyFilter(unittest.TestCase):
+    """Test the safety filter's async path against a stubbed service client."""
+
+    def setUp(self):
+        from types import SimpleNamespace
+        from src.safety_filter import SafetyFilter
+
+        def analyze_text(options):
+            severity = 6 if "attack" in options.text else 0
+            return SimpleNamespace(categories_analysis=[
+                SimpleNamespace(category="Hate", severity=severity),
+                SimpleNamespace(category="Violence", severity=0),
+            ])
+
+        self.filter = SafetyFilter()
+        self.filter._initialized = True
+        self.filter.client = SimpleNamespace(analyze_text=analyze_text)
+
+    def test_async_without_aiohttp_uses_sync_client(self):
+        """Without the aio transport the verdict should come from the sync client."""
+        from unittest import mock
+        try:
+            import azure.ai.contentsafety.models  # noqa: F401
+        except ImportError:
+            self.skipTest("azure-ai-contentsafety is not installed")
+
+        with mock.patch("src.safety_filter._AIO_TRANSPORT", False):
+            flagged = asyncio.run(self.filter.analyze_text_async("attack them"))
+            clean = asyncio.run(self.filter.analyze_text_async("my chest hurts"))
+        self.assertFalse(flagged["is_safe"])
+        self.assertEqual(flagged["flagged_categories"], ["Hate"])
+        self.assertTrue(clean["is_safe"])
+
+
+class TestSpeechHandler(unittest.TestCase):
+    """Test SDK object sharing in the speech handler with stubbed SDK objects."""
+
+    def setUp(self):
+        import threading
+        import time
+        from types import SimpleNamespace
+        from src import speech_handler
+
+        if speech_handler.speechsdk is None:
+            self.skipTest("azure-cognitiveservices-speech is not installed")
+        completed = SimpleNamespace(
+            reason=speech_handler.speechsdk.ResultReason.SynthesizingAudioCompleted
+        )
+        self.handler = speech_handler.SpeechHandler()
+        self.handler._initialized = True
+        self.handler._mic_recognizer = object()
+        self.handler._mic_recognizer_created_at = time.monotonic()
+        self.handler._synthesizers["en-US"] = SimpleNamespace(
+            speak_text_async=lambda text: SimpleNamespace(get=lambda: completed)
+        )
+        self.handler._synthesizer_locks["en-US"] = threading.Lock()
+
+    def test_tts_does_not_wait_behind_mic_capture(self):
+        """text_to_speech should complete while a mic recognition is in progress."""
+        import threading
+
+        spoken = []
+        with self.handler._mic_recognizer_lease():
+            worker = threading.Thread(
+                target=lambda: spoken.append(self.handler.text_to_speech("Hello"))
+            )
+            worker.start()
+            worker.join(timeout=2)
+            self.assertFalse(worker.is_alive(), "TTS blocked behind the mic lease")
+        self.assertEqual(spoken, [True])
+
 
 class TestMultiLanguageScenario(unittest.TestCase):
     """Integration test: German patient → English backend → German response."""